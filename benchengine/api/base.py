@@ -19,6 +19,8 @@ implementations (e.g., Flask, Tornado) to be used to implement a web service for
 the API.
 """
 
+import copy
+
 from benchengine.api.benchmark import BenchmarkApi
 from benchengine.api.route import UrlFactory
 from benchengine.api.serialize.base import Serializer
@@ -76,22 +78,35 @@ class EngineApi(object):
         ValueError
         """
         # Use database driver to get connection if the connection is not given
-        self.con = con if not con is None else DatabaseDriver.connect()
+        self.con = con if con is not None else DatabaseDriver.connect()
         # Set the base directory (either from given argument value or from the
         # value of the environment variable). Raise error if the base directory
         # value is None. Otherwise, create the directory if it does not exist.
-        self.base_dir = base_dir if not base_dir is None else config.get_base_dir()
+        self.base_dir = base_dir if base_dir is not None else config.get_base_dir()
         if self.base_dir is None:
             raise ValueError('no base directory given')
         util.create_dir(self.base_dir)
         # Use default benchmark engine if no backend is given
-        self.backend = backend if not backend is None else BenchmarkEngine(self.con)
+        self.backend = backend if backend is not None else BenchmarkEngine(self.con)
         # Create subfolder to store uploaded files for individual teams
         self.team_files_dir = config.get_upload_dir()
         util.create_dir(self.team_files_dir)
         # Set Url factory and serialized
-        self.urls = urls if not urls is None else UrlFactory()
+        self.urls = urls if urls is not None else UrlFactory()
         self.serialize = Serializer(self.urls)
+        # API components are created on first access and kept for the lifetime
+        # of the engine API. All components share the same database connection.
+        # The caches of the benchmark repository remain valid when benchmarks
+        # are added or deleted by other processes: handles are checked against
+        # the database and the listing snapshot expires after a short time.
+        self.benchmark_api = None
+        self.team_api = None
+        self.user_api = None
+        # The service descriptor does not change for the lifetime of the engine
+        # API. It is serialized on first access.
+        self.descriptor = None
+        # Service name that is read from the configuration on first access
+        self.service_name = None
 
     def close(self):
         """Close the database connection when the API is no longer used."""
@@ -99,40 +114,50 @@ class EngineApi(object):
 
     def benchmarks(self):
         """Get API component that provides methods to list benchmarks that a
-        user (or team) can submit solutions for.
+        user (or team) can submit solutions for. The component and its
+        benchmark repository are created once and reused by subsequent calls.
 
         Returns
         -------
         benchengine.api.benchmark.BenchmarkApi
         """
-        return BenchmarkApi(
-            repository=BenchmarkRepository(con=self.con),
-            backend=self.backend,
-            urls=self.urls
-        )
+        if self.benchmark_api is None:
+            self.benchmark_api = BenchmarkApi(
+                repository=BenchmarkRepository(con=self.con),
+                backend=self.backend,
+                urls=self.urls
+            )
+        return self.benchmark_api
 
     @property
     def name(self):
         """Each instance of the API should have a (unique) name to identify it.
+        The name is read from the configuration once.
 
         Returns
         -------
         string
         """
-        return config.get_service_name()
+        if self.service_name is None:
+            self.service_name = config.get_service_name()
+        return self.service_name
 
     def service_descriptor(self):
         """Get serialization of descriptor containing the basic information
-        about the API.
+        about the API. The serialization is generated once. Each call returns
+        a copy, i.e., callers may modify the result without affecting other
+        requests.
 
         Returns
         -------
         dict
         """
-        return self.serialize.service_descriptor(
-            name=self.name,
-            version=self.version
-        )
+        if self.descriptor is None:
+            self.descriptor = self.serialize.service_descriptor(
+                name=self.name,
+                version=self.version
+            )
+        return copy.deepcopy(self.descriptor)
 
     def teams(self):
         """Get the API component that implements methods to manage teams that
@@ -142,11 +167,13 @@ class EngineApi(object):
         --------
         benchengine.api.team.TeamApi
         """
-        return TeamApi(
-            manager=TeamManager(con=self.con),
-            base_dir=self.team_files_dir,
-            urls=self.urls
-        )
+        if self.team_api is None:
+            self.team_api = TeamApi(
+                manager=TeamManager(con=self.con),
+                base_dir=self.team_files_dir,
+                urls=self.urls
+            )
+        return self.team_api
 
     def users(self):
         """Get API component to access and manipulate user resources.
@@ -155,7 +182,12 @@ class EngineApi(object):
         -------
         benchengine.api.user.UserApi
         """
-        return UserApi(manager=UserManager(con=self.con), urls=self.urls)
+        if self.user_api is None:
+            self.user_api = UserApi(
+                manager=UserManager(con=self.con),
+                urls=self.urls
+            )
+        return self.user_api
 
     @property
     def version(self):
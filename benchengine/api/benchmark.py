@@ -59,7 +59,7 @@ class BenchmarkApi(object):
         # Authenticate the user for the given access token. This is to ensure
         # that the access token is valid. The user information is no further
         # used by this method.
-        if not access_token is None:
+        if access_token is not None:
             self.repository.authenticate(access_token)
         # Return serialized benchmark handle
         benchmark = self.repository.get_benchmark(benchmark_id)
@@ -94,7 +94,7 @@ class BenchmarkApi(object):
         # Authenticate the user for the given access token. This is to ensure
         # that the access token is valid. The user information is no further
         # used by this method.
-        if not access_token is None:
+        if access_token is not None:
             self.repository.authenticate(access_token)
         # Return serialized benchmark handle
         benchmark = self.repository.get_benchmark(benchmark_id)
@@ -121,7 +121,7 @@ class BenchmarkApi(object):
         # Authenticate the user for the given access token. This is to ensure
         # that the access token is valid. The user information is no further
         # used by this method.
-        if not access_token is None:
+        if access_token is not None:
             self.repository.authenticate(access_token)
         # Return serialized benchmark listing
         benchmarks = self.repository.list_benchmarks()
@@ -152,7 +152,7 @@ class BenchmarkApi(object):
         """
         # Authenticate the user for the given access token.
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.repository.authenticate(access_token).identifier
         # Get benchmark handle. This will raise an error if the benchmark
         # identifier is unknown.
@@ -16,6 +16,15 @@ class UrlFactory(object):
     manipulate resources. For each API route there is a corresponding factory
     method to generate the respective Url.
     """
+    __slots__ = (
+        'base_url',
+        'benchmark_base_url',
+        'login_url',
+        'logout_url',
+        'team_base_url',
+        'user_base_url'
+    )
+
     def __init__(self, base_url=None):
         """Initialize the base Url for the service API. If the argument is not
         given the value is expcted in the environment variable
@@ -26,18 +35,19 @@ class UrlFactory(object):
         base_url: string
             Base Url for all API resources
         """
-        # Set base Url depending on whether it is given as argument or not
+        # Set base Url depending on whether it is given as argument or not.
+        # Remove trailing '/' from the base url.
         if base_url is None:
-            self.base_url = config.get_apiurl()
-        else:
-            self.base_url = base_url
-        # Remove trailing '/' from the base url
-        while self.base_url.endswith('/'):
-            self.base_url = self.base_url[:-1]
+            base_url = config.get_apiurl()
+        self.base_url = base_url.rstrip('/')
         # Set base Url for resource related requests
         self.benchmark_base_url = self.base_url + '/benchmarks'
         self.team_base_url = self.base_url + '/teams'
         self.user_base_url = self.base_url + '/user'
+        # Urls for resources that do not take any parameters do not change for
+        # the lifetime of the factory. They are generated once here.
+        self.login_url = self.user_base_url + '/login'
+        self.logout_url = self.user_base_url + '/logout'
 
     def add_team_members(self, team_id):
         """Url to POST list of new team members.
@@ -51,7 +61,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_team(team_id) + '/members'
+        return f'{self.team_base_url}/{team_id}/members'
 
     def delete_file(self, team_id, file_id):
         """Url to DELETE a previously uploaded file.
@@ -67,7 +77,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.team_files(team_id) + '/' + file_id
+        return f'{self.team_base_url}/{team_id}/files/{file_id}'
 
     def download_file(self, team_id, file_id):
         """Url to GET a previously uploaded file.
@@ -83,7 +93,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.team_files(team_id) + '/' + file_id + '/download'
+        return f'{self.team_base_url}/{team_id}/files/{file_id}/download'
 
     def get_benchmark(self, benchmark_id):
         """Url to GET benchmark handle.
@@ -97,7 +107,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.benchmark_base_url + '/' + benchmark_id
+        return f'{self.benchmark_base_url}/{benchmark_id}'
 
     def get_leaderboard(self, benchmark_id):
         """Url to GET benchmark leaderboard.
@@ -111,7 +121,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_benchmark(benchmark_id) + '/leaderboard'
+        return f'{self.benchmark_base_url}/{benchmark_id}/leaderboard'
 
     def get_team(self, team_id):
         """Url to GET team handle.
@@ -125,7 +135,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.team_base_url + '/' + team_id
+        return f'{self.team_base_url}/{team_id}'
 
     def list_benchmarks(self):
         """Url to GET a list of all benchmarks.
@@ -153,7 +163,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.user_base_url + '/login'
+        return self.login_url
 
     def logout(self):
         """Url to POST user logout request.
@@ -162,7 +172,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.user_base_url + '/logout'
+        return self.logout_url
 
     def remove_team_member(self, team_id, user_id):
         """Url to DELETE a member for a team.
@@ -178,7 +188,26 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.add_team_members(team_id) + '/' + user_id
+        return f'{self.team_base_url}/{team_id}/members/{user_id}'
+
+    def remove_team_members(self, team_id, user_ids):
+        """Urls to DELETE members for a team. The result is a dictionary that
+        maps each of the given user identifier to the respective Url. The Url
+        prefix for the team is only generated once.
+
+        Parameters
+        ----------
+        team_id: string
+            Unique team identifier
+        user_ids: list(string)
+            List of unique user identifier
+
+        Returns
+        -------
+        dict
+        """
+        prefix = f'{self.team_base_url}/{team_id}/members/'
+        return {user_id: prefix + user_id for user_id in user_ids}
 
     def service_descriptor(self):
         """Url to GET the service descriptor.
@@ -201,7 +230,7 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.get_team(team_id) + '/files'
+        return f'{self.team_base_url}/{team_id}/files'
 
     def upload_file(self, team_id):
         """Url to POST a new file to upload. The uploaded file is associated
@@ -219,4 +248,4 @@ class UrlFactory(object):
         -------
         string
         """
-        return self.team_files(team_id) + '/upload'
+        return f'{self.team_base_url}/{team_id}/files/upload'
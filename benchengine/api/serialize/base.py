@@ -14,10 +14,19 @@ import benchengine.api.serialize.hateoas as hateoas
 import benchengine.api.serialize.labels as labels
 
 
+"""Maximum number of entries that a serializer keeps in its cache of HATEOAS
+reference Urls. If the limit is exceeded the least recently used entries are
+discarded first.
+"""
+LINK_CACHE_SIZE = 4096
+
+
 class Serializer(object):
     """Basic serialization methods that are inherited by the more specific
     serializers for different API resources.
     """
+    __slots__ = ('urls',)
+
     def __init__(self, urls):
         """Initialize the Url factory.
 
@@ -43,21 +52,25 @@ class Serializer(object):
         -------
         dict
         """
+        file_id = fh.identifier
         return {
-            labels.ID: fh.identifier,
+            labels.ID: file_id,
             labels.NAME: fh.name,
             labels.CREATED_AT: fh.created_at.isoformat(),
             labels.FILESIZE: fh.size,
-            labels.LINKS: hateoas.serialize({
-                hateoas.DELETE: self.urls.delete_file(
-                    team_id=team_id,
-                    file_id=fh.identifier
+            labels.LINKS: [
+                hateoas.reference(
+                    rel=hateoas.DELETE,
+                    href=self.urls.delete_file(team_id=team_id, file_id=file_id)
                 ),
-                hateoas.DOWNLOAD: self.urls.download_file(
-                    team_id=team_id,
-                    file_id=fh.identifier
+                hateoas.reference(
+                    rel=hateoas.DOWNLOAD,
+                    href=self.urls.download_file(
+                        team_id=team_id,
+                        file_id=file_id
+                    )
                 )
-            })
+            ]
         }
 
     def service_descriptor(self, name, version):
@@ -102,6 +115,6 @@ class Serializer(object):
         """
         obj = {labels.STATE: 'SUCCESS'}
         # Add optional HATEOAS references if given
-        if not links is None:
+        if links is not None:
             obj[labels.LINKS] = hateoas.serialize(links)
         return obj
@@ -8,17 +8,47 @@
 
 """Interface to serialize benchmark resource objects."""
 
+from collections import OrderedDict
 
-from benchengine.api.serialize.base import Serializer
+from benchengine.api.serialize.base import Serializer, LINK_CACHE_SIZE
 
 import benchengine.api.serialize.hateoas as hateoas
 import benchengine.api.serialize.labels as labels
 
 
+"""Maximum number of benchmark result schema serializations that a serializer
+keeps in its cache. If the limit is exceeded the least recently used entries
+are discarded first.
+"""
+SCHEMA_CACHE_SIZE = 128
+
+
+def serialize_schema(schema):
+    """Get serialization for the columns in a benchmark result schema.
+
+    Parameters
+    ----------
+    schema: benchtmpl.workflow.benchmark.schema.BenchmarkResultSchema
+        Benchmark result schema
+
+    Returns
+    -------
+    list(dict)
+    """
+    return [{
+            labels.ID: c.identifier,
+            labels.NAME: c.name,
+            labels.DATA_TYPE: c.data_type
+        } for c in schema.columns
+    ]
+
+
 class BenchmarkSerializer(Serializer):
     """Serializer for benchmark resource objects. Defines the methods that are
     used to serialize benchmark descriptors and handles.
     """
+    __slots__ = ('benchmark_links', 'schemas')
+
     def __init__(self, urls):
         """Initialize the reference to the Url factory.
 
@@ -28,6 +58,17 @@ class BenchmarkSerializer(Serializer):
             Factory for resource urls
         """
         super(BenchmarkSerializer, self).__init__(urls)
+        # Cache for the HATEOAS reference Urls of benchmark descriptors. The
+        # references only depend on the benchmark identifier. The list of links
+        # is created for each serialization from the cached Urls. The cache is
+        # bounded and discards the least recently used entries first.
+        self.benchmark_links = OrderedDict()
+        # Cache for serialized result schemas of benchmark leaderboards. The
+        # schema of a benchmark does not change. Entries are keyed by the
+        # benchmark identifier so that the cache does not keep references to
+        # benchmark templates. Cached column serializations are copied for
+        # each leaderboard.
+        self.schemas = OrderedDict()
 
     def benchmark_descriptor(self, benchmark):
         """Get dictionary serialization containing the descriptor of a
@@ -43,14 +84,22 @@ class BenchmarkSerializer(Serializer):
         dict
         """
         benchmark_id = benchmark.identifier
-        leaderboard_url = self.urls.get_leaderboard(benchmark_id)
+        refs = self.benchmark_links.get(benchmark_id)
+        if refs is None:
+            leaderboard_url = self.urls.get_leaderboard(benchmark_id)
+            refs = {
+                hateoas.SELF: self.urls.get_benchmark(benchmark_id),
+                hateoas.benchmark(hateoas.LEADERBOARD): leaderboard_url
+            }
+            self.benchmark_links[benchmark_id] = refs
+            if len(self.benchmark_links) > LINK_CACHE_SIZE:
+                self.benchmark_links.popitem(last=False)
+        else:
+            self.benchmark_links.move_to_end(benchmark_id)
         obj = {
             labels.ID: benchmark_id,
             labels.NAME: benchmark.name,
-            labels.LINKS: hateoas.serialize({
-                hateoas.SELF: self.urls.get_benchmark(benchmark_id),
-                hateoas.benchmark(hateoas.LEADERBOARD): leaderboard_url
-            })
+            labels.LINKS: hateoas.serialize(refs)
         }
         if benchmark.has_description():
             obj[labels.DESCRIPTION] = benchmark.description
@@ -90,22 +139,26 @@ class BenchmarkSerializer(Serializer):
         -------
         dict
         """
-        runs = list()
-        for run in leaderboard:
-            results = list()
-            for key in run.results:
-                results.append({labels.ID: key, labels.VALUE: run.results[key]})
-            runs.append({
-                labels.USERNAME: run.user.username,
-                labels.RESULTS: results
-            })
+        # Bind labels to local variables. This method is called for
+        # leaderboards with potentially large numbers of runs.
+        ID, VALUE = labels.ID, labels.VALUE
+        USERNAME, RESULTS = labels.USERNAME, labels.RESULTS
+        runs = [{
+                USERNAME: run.user.username,
+                RESULTS: [{ID: key, VALUE: val} for key, val in run.results.items()]
+            } for run in leaderboard
+        ]
+        benchmark_id = benchmark.identifier
+        columns = self.schemas.get(benchmark_id)
+        if columns is None:
+            columns = serialize_schema(benchmark.template.schema)
+            self.schemas[benchmark_id] = columns
+            if len(self.schemas) > SCHEMA_CACHE_SIZE:
+                self.schemas.popitem(last=False)
+        else:
+            self.schemas.move_to_end(benchmark_id)
         return {
-            labels.SCHEMA: [{
-                    labels.ID: c.identifier,
-                    labels.NAME: c.name,
-                    labels.DATA_TYPE: c.data_type
-                } for c in benchmark.template.schema.columns
-            ],
+            labels.SCHEMA: [dict(c) for c in columns],
             labels.RUNS: runs
         }
 
@@ -123,9 +176,12 @@ class BenchmarkSerializer(Serializer):
         """
         return {
             labels.BENCHMARKS: [self.benchmark_descriptor(b) for b in benchmarks],
-            labels.LINKS: hateoas.serialize({
-                hateoas.SELF: self.urls.list_benchmarks()
-            })
+            labels.LINKS: [
+                hateoas.reference(
+                    rel=hateoas.SELF,
+                    href=self.urls.list_benchmarks()
+                )
+            ]
         }
 
     def benchmark_run(self, benchmark_id, run_id, state):
@@ -102,6 +102,24 @@ def deserialize(links):
     return result
 
 
+def reference(rel, href):
+    """Serialize a single HATEOAS reference. Avoids creating an intermediate
+    dictionary for short link lists with a fixed set of references.
+
+    Parameters
+    ----------
+    rel: string
+        Link relationship identifier
+    href: string
+        Link target Url
+
+    Returns
+    -------
+    dict
+    """
+    return {labels.REL: rel, labels.REF: href}
+
+
 def serialize(links):
     """Serialize a given set of HATEOAS references. Each reference is an entry
     in the given dictionary. The key defines the HATEOAS relationship type for
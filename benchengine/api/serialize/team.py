@@ -8,7 +8,9 @@
 
 """Serializer for team resources."""
 
-from benchengine.api.serialize.base import Serializer
+from collections import OrderedDict
+
+from benchengine.api.serialize.base import Serializer, LINK_CACHE_SIZE
 
 import benchengine.api.serialize.hateoas as hateoas
 import benchengine.api.serialize.labels as labels
@@ -16,6 +18,8 @@ import benchengine.api.serialize.labels as labels
 
 class TeamSerializer(Serializer):
     """Serializer for team resources."""
+    __slots__ = ('team_links',)
+
     def __init__(self, urls):
         """Initialize the reference to the Url factory.
 
@@ -25,6 +29,24 @@ class TeamSerializer(Serializer):
             Factory for resource urls
         """
         super(TeamSerializer, self).__init__(urls)
+        # Cache for the HATEOAS reference Urls of team descriptors. The
+        # references depend on the team identifier and on whether the current
+        # user is the team owner. The list of links is created for each
+        # serialization from the cached Urls. The cache is bounded and discards
+        # the least recently used entries first.
+        self.team_links = OrderedDict()
+
+    def remove_team(self, team_id):
+        """Remove the cached HATEOAS references for the team with the given
+        identifier. Called when a team is deleted.
+
+        Parameters
+        ----------
+        team_id: string
+            Unique team identifier
+        """
+        self.team_links.pop((team_id, True), None)
+        self.team_links.pop((team_id, False), None)
 
     def team_descriptor(self, team, user_id=None):
         """Get serialization for a team descriptor. The optional user identifier
@@ -44,20 +66,29 @@ class TeamSerializer(Serializer):
         dict
         """
         team_id = team.identifier
-        team_url = self.urls.get_team(team_id)
-        links = {
-            hateoas.SELF: team_url,
-            hateoas.UPLOAD: self.urls.upload_file(team_id)
-        }
-        if user_id is None or user_id == team.owner_id:
-            links[hateoas.DELETE] = team_url
-            links[hateoas.ADD] = self.urls.add_team_members(team_id)
+        is_owner = user_id is None or user_id == team.owner_id
+        key = (team_id, is_owner)
+        refs = self.team_links.get(key)
+        if refs is None:
+            team_url = self.urls.get_team(team_id)
+            refs = {
+                hateoas.SELF: team_url,
+                hateoas.UPLOAD: self.urls.upload_file(team_id)
+            }
+            if is_owner:
+                refs[hateoas.DELETE] = team_url
+                refs[hateoas.ADD] = self.urls.add_team_members(team_id)
+            self.team_links[key] = refs
+            if len(self.team_links) > LINK_CACHE_SIZE:
+                self.team_links.popitem(last=False)
+        else:
+            self.team_links.move_to_end(key)
         return {
             labels.ID: team_id,
             labels.NAME: team.name,
             labels.OWNER_ID: team.owner_id,
             labels.MEMBER_COUNT: team.member_count,
-            labels.LINKS: hateoas.serialize(links)
+            labels.LINKS: hateoas.serialize(refs)
         }
 
     def team_handle(self, team, user_id=None):
@@ -79,20 +110,25 @@ class TeamSerializer(Serializer):
         # The serialization of the team handle is an extension of the team
         # descriptor serialization
         obj = self.team_descriptor(team, user_id=user_id)
-        # Add serializations for all team members
-        members = list()
-        for user in team.members.values():
-            members.append({
-                    labels.ID: user.identifier,
-                    labels.USERNAME: user.username,
-                    labels.LINKS: hateoas.serialize({
-                        hateoas.DELETE: self.urls.remove_team_member(
-                            team_id=team.identifier,
-                            user_id=user.identifier
-                        )
-                    })
-                })
-        obj[labels.MEMBERS] = members
+        # Add serializations for all team members. Labels are bound to local
+        # variables since they are accessed for every team member. The Urls to
+        # remove team members are generated in a single call.
+        ID, USERNAME, LINKS = labels.ID, labels.USERNAME, labels.LINKS
+        remove_urls = self.urls.remove_team_members(
+            team_id=team.identifier,
+            user_ids=team.members.keys()
+        )
+        obj[labels.MEMBERS] = [{
+                ID: user.identifier,
+                USERNAME: user.username,
+                LINKS: [
+                    hateoas.reference(
+                        rel=hateoas.DELETE,
+                        href=remove_urls[user.identifier]
+                    )
+                ]
+            } for user in team.members.values()
+        ]
         return obj
 
     def team_listing(self, teams, user_id=None):
@@ -14,8 +14,17 @@ import benchengine.api.serialize.hateoas as hateoas
 import benchengine.api.serialize.labels as labels
 
 
+"""Link relationship types for user resources. The category prefix is added
+once when the module is loaded.
+"""
+REL_LOGIN = hateoas.user(hateoas.LOGIN)
+REL_LOGOUT = hateoas.user(hateoas.LOGOUT)
+
+
 class UserSerializer(Serializer):
     """Serializer for user resources."""
+    __slots__ = ('login_refs', 'user_refs')
+
     def __init__(self, urls):
         """Initialize the reference to the Url factory.
 
@@ -25,6 +34,17 @@ class UserSerializer(Serializer):
             Factory for resource urls
         """
         super(UserSerializer, self).__init__(urls)
+        # The HATEOAS reference Urls for login and user serializations do not
+        # depend on the serialized object. They are generated once. The list
+        # of links is created for each serialization.
+        self.login_refs = {
+            hateoas.SERVICE: urls.service_descriptor(),
+            REL_LOGOUT: urls.logout()
+        }
+        self.user_refs = {
+            REL_LOGIN: urls.login(),
+            REL_LOGOUT: urls.logout()
+        }
 
     def login(self, access_token):
         """Serialization for successful login. Contains tha access token and a
@@ -41,10 +61,7 @@ class UserSerializer(Serializer):
         """
         return {
             labels.ACCESS_TOKEN: access_token,
-            labels.LINKS: hateoas.serialize({
-                hateoas.SERVICE: self.urls.service_descriptor(),
-                hateoas.user(hateoas.LOGOUT): self.urls.logout()
-            })
+            labels.LINKS: hateoas.serialize(self.login_refs)
         }
 
     def user(self, user):
@@ -62,8 +79,5 @@ class UserSerializer(Serializer):
         return {
             labels.ID: user.identifier,
             labels.USERNAME: user.username,
-            labels.LINKS: hateoas.serialize({
-                hateoas.user(hateoas.LOGIN): self.urls.login(),
-                hateoas.user(hateoas.LOGOUT): self.urls.logout()
-            })
+            labels.LINKS: hateoas.serialize(self.user_refs)
         }
@@ -44,6 +44,8 @@ class TeamApi(object):
         self.urls = urls
         self.base_dir = base_dir
         self.serialize = TeamSerializer(urls)
+        # Cache for file stores of individual teams keyed by the team identifier
+        self.filestores = dict()
 
     def add_members(self, team_id, members, access_token=None):
         """Add new members to a given team. Team members are identified by their
@@ -73,14 +75,13 @@ class TeamApi(object):
         # Get user identifier if access token is given. Ensure that user is the
         # team owner.
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
                 role=role.OWNER
             )
-        for member_id in members:
-            self.manager.add_member(team_id=team_id, user_id=member_id)
+        self.manager.add_members(team_id=team_id, user_ids=members)
         # Return serialized team handle
         team = self.manager.get_team(team_id)
         return self.serialize.team_handle(team, user_id=user_id)
@@ -143,19 +144,20 @@ class TeamApi(object):
         benchengine.error.UnknownFileError
         benchengine.error.UnknownTeamError
         """
-        # Ensure that the team exists
-        self.manager.assert_team_exists(team_id)
         # If the access token is given, ensure that user is a team member.
-        if not access_token is None:
+        # Authorization fails for unknown teams. Otherwise, ensure that the
+        # team exists.
+        if access_token is not None:
             self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
                 role=role.MEMBER
             )
+        else:
+            self.manager.assert_team_exists(team_id)
         # Delete file. If result is False (i.e., the file did not exist) an
         # error is raised
-        fs = Filestore(os.path.join(self.base_dir, team_id))
-        if not fs.delete_file(file_id):
+        if not self.get_filestore(team_id).delete_file(file_id):
             raise err.UnknownFileError(file_id)
         return self.serialize.success()
 
@@ -180,13 +182,15 @@ class TeamApi(object):
         """
         # Get user identifier if access token is given. Ensure that user is the
         # team owner.
-        if not access_token is None:
+        if access_token is not None:
             self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
                 role=role.OWNER
             )
         self.manager.delete_team(team_id)
+        self.filestores.pop(team_id, None)
+        self.serialize.remove_team(team_id)
         return self.serialize.success()
 
     def get_file(self, team_id, file_id, access_token=None):
@@ -213,21 +217,42 @@ class TeamApi(object):
         benchengine.error.UnknownFileError
         benchengine.error.UnknownTeamError
         """
-        # Ensure that the team exists
-        self.manager.assert_team_exists(team_id)
         # If the access token is given, ensure that user is a team member.
-        if not access_token is None:
+        # Authorization fails for unknown teams. Otherwise, ensure that the
+        # team exists.
+        if access_token is not None:
             self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
                 role=role.MEMBER
             )
+        else:
+            self.manager.assert_team_exists(team_id)
         # Get serialized file handle. Raise error if the file does not exist.
-        fh = Filestore(os.path.join(self.base_dir, team_id)).get_file(file_id)
+        fh = self.get_filestore(team_id).get_file(file_id)
         if fh is None:
             raise err.UnknownFileError(file_id)
         return self.serialize.file_handle(fh=fh, team_id=team_id)
 
+    def get_filestore(self, team_id):
+        """Get the file store for uploaded files of the team with the given
+        identifier. File stores are created on first access and cached.
+
+        Parameters
+        ----------
+        team_id: string
+            Unique team identifier
+
+        Returns
+        -------
+        benchtmpl.io.files.store.Filestore
+        """
+        fs = self.filestores.get(team_id)
+        if fs is None:
+            fs = Filestore(os.path.join(self.base_dir, team_id))
+            self.filestores[team_id] = fs
+        return fs
+
     def get_team(self, team_id, access_token=None):
         """Get handle for team with given identifier. If the access token is
         given it is confirmed that the user is a member of the team.
@@ -256,7 +281,7 @@ class TeamApi(object):
         # Get user identifier if access token is given. Ensure that the user is
         # at least a team member
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
@@ -285,7 +310,7 @@ class TeamApi(object):
         # Get the identifier for the registered user that is associated with the
         # access token if given
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.manager.authenticate(access_token).identifier
         # Return serialized team listing
         teams = self.manager.list_teams(user_id=user_id)
@@ -320,7 +345,7 @@ class TeamApi(object):
         # Team members can remove themselves from a team but not any other
         # team member.
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
@@ -363,7 +388,7 @@ class TeamApi(object):
         # Get user identifier if access token is given. Ensure that user is the
         # team owner.
         user_id = None
-        if not access_token is None:
+        if access_token is not None:
             user_id = self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
@@ -391,16 +416,20 @@ class TeamApi(object):
         -------
         benchengine.filestore.base.FileHandle
         """
-        # Ensure that the team exists
-        self.manager.assert_team_exists(team_id)
         # If the access token is given, ensure that user is a team member.
-        if not access_token is None:
+        # Authorization fails for unknown teams. Otherwise, ensure that the
+        # team exists.
+        if access_token is not None:
             self.manager.authorize(
                 access_token=access_token,
                 team_id=team_id,
                 role=role.MEMBER
             )
+        else:
+            self.manager.assert_team_exists(team_id)
         # Store file and return serialized file handle.
-        fs = Filestore(os.path.join(self.base_dir, team_id))
-        fh = fs.upload_stream(file=file, file_name=file_name)
+        fh = self.get_filestore(team_id).upload_stream(
+            file=file,
+            file_name=file_name
+        )
         return self.serialize.file_handle(fh=fh, team_id=team_id)
@@ -18,7 +18,7 @@ short description, and an optional set of instructions.
 from benchengine.user.base import RegisteredUser
 
 import benchengine.error as err
-import benchtmpl.workflow.state as state
+import benchtmpl.workflow.parameter.declaration as pd
 
 
 """Prefix for all benchmark result tables. The table name is a concatenation of
@@ -26,6 +26,36 @@ the prefix and the template identifier.
 """
 PREFIX_RESULT_TABLE = 'res_'
 
+"""Mapping of result column data types to SQL column types. Columns of any
+other data type are stored as TEXT.
+"""
+DDL_TYPES = {pd.DT_INTEGER: ' INTEGER', pd.DT_DECIMAL: ' DOUBLE'}
+
+"""Marker for result values that are missing in the result dictionary of a
+benchmark run. Distinguishes missing values from values that are None.
+"""
+MISSING = object()
+
+
+def get_column_ddl_stmt(col):
+    """Get the SQL statement for a result column in a CREATE TABLE statement.
+
+    Parameters
+    ----------
+    col: benchtmpl.workflow.benchmark.schema.BenchmarkResultColumn
+        Column in the benchmark result schema
+
+    Returns
+    -------
+    string
+    """
+    return (
+        col.identifier
+        + DDL_TYPES.get(col.data_type, ' TEXT')
+        + (' NOT NULL' if col.required else '')
+    )
+
+
 class BenchmarkDescriptor(object):
     """The basic information for benchmarks in listings contains the unique
     identifier, name, an optional short description, and an optional set of
@@ -60,7 +90,7 @@ class BenchmarkDescriptor(object):
         -------
         bool
         """
-        return not self.description is None
+        return self.description is not None
 
     def has_instructions(self):
         """Test if the instructions for the benchmark are set.
@@ -69,7 +99,7 @@ class BenchmarkDescriptor(object):
         -------
         bool
         """
-        return not self.instructions is None
+        return self.instructions is not None
 
 
 class BenchmarkHandle(BenchmarkDescriptor):
@@ -105,17 +135,30 @@ class BenchmarkHandle(BenchmarkDescriptor):
         # The result table name is the concatenation of the common prefix and
         # the benchmark identifier
         self.result_table_name = PREFIX_RESULT_TABLE + self.identifier
+        # List of (identifier, required) pairs for all columns in the result
+        # schema. Used to validate and insert run results.
+        self.result_columns = [
+            (col.identifier, col.required) for col in template.schema.columns
+        ]
+        # The statement to insert run results is the same for all runs of the
+        # benchmark. Generate it once for the column order in result_columns.
+        self.insert_results_sql = 'INSERT INTO {}(run_id,{}) VALUES(?{})'.format(
+            self.result_table_name,
+            ','.join([col_id for col_id, _ in self.result_columns]),
+            ',?' * len(self.result_columns)
+        )
 
     def create_result_table(self):
         """Create table to store benchmark results bases on the benchmark schema
-        specification.
+        specification. The statement is not committed. This allows the caller to
+        create the table as part of a larger transaction.
         """
-        cols = list(['run_id  CHAR(32) NOT NULL'])
-        for col in self.template.schema.columns:
-            cols.append(col.sql_stmt())
+        cols = ','.join([
+            'run_id  CHAR(32) NOT NULL',
+            *map(get_column_ddl_stmt, self.template.schema.columns)
+        ])
         sql = 'CREATE TABLE {}({}, PRIMARY KEY(run_id))'
-        self.con.execute(sql.format(self.result_table_name, ','.join(cols)))
-        self.con.commit()
+        self.con.execute(sql.format(self.result_table_name, cols))
 
     def get_leaderboard(self, sort_key=None, all_entries=False):
         """Get current leaderboard for the benchmark. The result is a list of
@@ -146,7 +189,7 @@ class BenchmarkHandle(BenchmarkDescriptor):
                     sort_stmt = col.sort_statement()
             else:
                 cols.append(col)
-                if not sort_key is None and col.identifier == sort_key:
+                if sort_key is not None and col.identifier == sort_key:
                     sort_stmt = col.sort_statement()
         col_names = list()
         for col in cols:
@@ -161,12 +204,11 @@ class BenchmarkHandle(BenchmarkDescriptor):
         sql += '{} r '.format(self.result_table_name)
         sql += 'WHERE u.id = b.user_id AND b.run_id = r.run_id '
         sql += 'ORDER BY {}'.format(sort_stmt)
-        rs = self.con.execute(sql).fetchall()
         # Keep track of users for which we have results (only needed if the
         # all_entries flag is False)
         users = set()
         leaderboard = list()
-        for row in rs:
+        for row in self.con.execute(sql):
             user = RegisteredUser(identifier=row[0], email=row[1])
             if user.identifier in users and not all_entries:
                 continue
@@ -182,6 +224,8 @@ class BenchmarkHandle(BenchmarkDescriptor):
     def insert_results(self, run_id, results):
         """Insert the results of a benchmark run into the results table. Expects
         a dictionary that contains result values for all mandatory results.
+        The statement is not committed. This allows the caller to insert the
+        results as part of a larger transaction.
 
         Parameters
         ----------
@@ -194,23 +238,18 @@ class BenchmarkHandle(BenchmarkDescriptor):
         ------
         benchengine.error.ConstraintViolationError
         """
-        columns = list(['run_id'])
-        values = list([run_id])
-        for col in self.template.schema.columns:
-            if col.identifier in results:
-                values.append(results[col.identifier])
-            elif col.required:
-                raise err.ConstraintViolationError('missing result for \'{}\''.format(col.identifier))
-            else:
-                values.append(None)
-            columns.append(col.identifier)
-        sql = 'INSERT INTO {}({}) VALUES({})'.format(
-            self.result_table_name,
-            ','.join(columns),
-            ','.join(['?'] * len(columns))
-        )
-        self.con.execute(sql, values)
-        self.con.commit()
+        # Get the value for each result column with a single dictionary lookup.
+        # Raise an error if a value for a required column is missing.
+        get_value = results.get
+        values = [run_id]
+        for col_id, required in self.result_columns:
+            value = get_value(col_id, MISSING)
+            if value is MISSING:
+                if required:
+                    raise err.ConstraintViolationError('missing result for \'{}\''.format(col_id))
+                value = None
+            values.append(value)
+        self.con.execute(self.insert_results_sql, values)
 
 
 class LeaderboardEntry(object):
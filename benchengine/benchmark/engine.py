@@ -11,11 +11,17 @@ This implementation of the engine executes all workflows synchronously. It is
 primarily intended for test purposes and NOT for production systems.
 """
 
-import os
-
 import benchtmpl.util.core as util
 
 
+"""SQL statement to insert information about a benchmark run."""
+SQL_INSERT_RUN = (
+    'INSERT INTO benchmark_run('
+    'run_id, benchmark_id, user_id, state, created_at, started_at, ended_at'
+    ') VALUES(?, ?, ?, ?, ?, ?, ?)'
+)
+
+
 class BenchmarkEngine(object):
     """Benchmark engine to execute benchmark workflows for a given set of
     argument values. All workflows are executed synchronously. After a workflow
@@ -56,25 +62,30 @@ class BenchmarkEngine(object):
         benchtmpl.error.MissingArgumentError
         """
         # Execute the benchmark workflow for the given set of arguments.
-        run_id, state = backend.execute(
+        run_id, state = self.backend.execute(
             template=benchmark.template,
             arguments=arguments
         )
-        # Insert run info and run results into database. The run results are
-        # only available if case of a successful run.
+        # Read the run results. The results are only available if case of a
+        # successful run.
+        results = None
         if state.is_success():
             fh = state.resources[benchmark.template.schema.result_file_id]
             results = util.read_object(fh.filepath)
-            benchmark.insert_results(run_id=run_id, results=results)
-        sql = 'INSERT INTO benchmark_run('
-        sql += 'run_id, benchmark_id, user_id, state, created_at, started_at, ended_at'
-        sql += ') VALUES(?, ?, ?, ?, ?, ?, ?)'
         s_type = state.type_id
+        t_create = state.created_at.isoformat()
         t_start = state.started_at.isoformat()
         if not state.is_active():
             t_end = state.finished_at.isoformat()
         else:
             t_end = None
-        self.con.execute(sql, (run_id, benchmark.identifier, user_id, s_type, t_start, t_end))
-        self.con.commit()
+        # Insert run results and run info into database within a single
+        # transaction.
+        with self.con:
+            if results is not None:
+                benchmark.insert_results(run_id=run_id, results=results)
+            self.con.execute(
+                SQL_INSERT_RUN,
+                (run_id, benchmark.identifier, user_id, s_type, t_create, t_start, t_end)
+            )
         return run_id, state
@@ -12,15 +12,46 @@ stored in the underlying database, together with the workflow template and the
 result files of individual workflow runs.
 """
 
+import time
+
 from benchengine.benchmark.base import BenchmarkDescriptor, BenchmarkHandle
 from benchengine.user.auth import Auth
-from benchtmpl.workflow.benchmark.loader import BenchmarkTemplateLoader
-from benchtmpl.workflow.template.repo import TemplateRepository
 
 import benchengine.config as config
 import benchengine.error as err
 
 
+"""SQL statements that are used by the benchmark repository. Statements are
+defined once at module level to avoid re-building the query strings on every
+call.
+"""
+SQL_BENCHMARK_BY_NAME = 'SELECT id FROM benchmark WHERE name = ?'
+SQL_BENCHMARK_EXISTS = 'SELECT id FROM benchmark WHERE id = ?'
+SQL_DELETE_BENCHMARK = 'DELETE FROM benchmark WHERE id = ?'
+SQL_GET_BENCHMARK = (
+    'SELECT name, description, instructions '
+    'FROM benchmark '
+    'WHERE id = ?'
+)
+SQL_INSERT_BENCHMARK = (
+    'INSERT INTO benchmark'
+    '(id, name, description, instructions) '
+    'VALUES(?, ?, ?, ?)'
+)
+SQL_LIST_BENCHMARKS = (
+    'SELECT id, name, description, instructions '
+    'FROM benchmark'
+)
+
+
+"""Default time (in seconds) for which a snapshot of the benchmark listing is
+served from the cache. Benchmarks may be added or deleted by other repository
+instances that share the same database (e.g., different server processes or
+the command line interface).
+"""
+DEFAULT_LISTING_TTL = 10
+
+
 class BenchmarkRepository(Auth):
     """The repository maintains benchmarks as well as the results of benchmark
     runs. The repository is a wrapper around two components:
@@ -29,7 +60,7 @@ class BenchmarkRepository(Auth):
     (2) the database to store benchamrk informations (e.g., name, descritption)
         and information about result files for workflow runs.
     """
-    def __init__(self, con, template_store=None):
+    def __init__(self, con, template_store=None, listing_ttl=None):
         """Initialize the database connection and the template store.
 
         Parameters
@@ -38,17 +69,41 @@ class BenchmarkRepository(Auth):
             Connection to underlying database
         template_store: benchtmpl.workflow.template.repo.TemplateRepository, optional
             Repository for workflow templates
+        listing_ttl: int, optional
+            Time (in seconds) for which the cached benchmark listing is valid
         """
         super(BenchmarkRepository, self).__init__(con)
-        if not template_store is None:
+        if template_store is not None:
             self.template_store = template_store
         else:
+            # Import the default template repository only when needed. The
+            # repository module depends on the (expensive to import) Git
+            # package.
+            from benchtmpl.workflow.benchmark.loader import BenchmarkTemplateLoader
+            from benchtmpl.workflow.template.repo import TemplateRepository
             template_dir = config.get_template_dir()
             self.template_store = TemplateRepository(
                 base_dir=template_dir,
                 loader=BenchmarkTemplateLoader(),
                 filenames=['benchmark', 'template', 'workflow']
             )
+        # Cache for workflow templates (including the benchmark result schema)
+        # keyed by the benchmark identifier. Templates are immutable for the
+        # lifetime of a benchmark.
+        self.template_cache = dict()
+        # Cache for benchmark handles keyed by the benchmark identifier and
+        # snapshot of the benchmark listing. Both are invalidated when this
+        # repository instance adds or deletes a benchmark. Cached handles are
+        # only returned for benchmarks that still exist in the database. The
+        # listing snapshot expires after the listing time-to-live to pick up
+        # changes that were made by other repository instances.
+        self.benchmark_cache = dict()
+        self.benchmark_list = None
+        self.benchmark_list_expires = 0
+        if listing_ttl is not None:
+            self.listing_ttl = listing_ttl
+        else:
+            self.listing_ttl = DEFAULT_LISTING_TTL
 
     def add_benchmark(
         self, name, description=None, instructions=None, src_dir=None,
@@ -96,8 +151,7 @@ class BenchmarkRepository(Auth):
         name = name.strip()
         if name == '' or len(name) > 255:
             raise err.ConstraintViolationError('invalid benchmark name')
-        sql = 'SELECT id FROM benchmark WHERE name = ?'
-        if not self.con.execute(sql, (name,)).fetchone() is None:
+        if self.con.execute(SQL_BENCHMARK_BY_NAME, (name,)).fetchone() is not None:
             raise err.ConstraintViolationError('benchmark \'{}\' exists'.format(name))
         # Create the workflow template in the associated template repository
         template = self.template_store.add_template(
@@ -105,15 +159,10 @@ class BenchmarkRepository(Auth):
             src_repo_url=src_repo_url,
             template_spec_file=template_spec_file
         )
-        # Insert benchmark into database and return descriptor
-        sql = 'INSERT INTO benchmark'
-        sql += '(id, name, description, instructions) '
-        sql += 'VALUES(?, ?, ?, ?)'
-        self.con.execute(
-            sql,
-            (template.identifier, name, description, instructions)
-        )
-        self.con.commit()
+        # Insert benchmark into database and create the result table within a
+        # single transaction. If the transaction fails the workflow template is
+        # removed from the template store to avoid orphaned templates. Return
+        # handle for the new benchmark.
         handle = BenchmarkHandle(
             con=self.con,
             template=template,
@@ -121,7 +170,21 @@ class BenchmarkRepository(Auth):
             description=description,
             instructions=instructions
         )
-        handle.create_result_table()
+        try:
+            with self.con:
+                self.con.execute(
+                    SQL_INSERT_BENCHMARK,
+                    (template.identifier, name, description, instructions)
+                )
+                handle.create_result_table()
+        except Exception:
+            self.template_store.delete_template(template.identifier)
+            raise
+        # Add the new template and benchmark handle to the cache to avoid
+        # reloading them on first access. Invalidate the benchmark listing.
+        self.template_cache[template.identifier] = template
+        self.benchmark_cache[template.identifier] = handle
+        self.benchmark_list = None
         return handle
 
     def assert_benchmark_exists(self, benchmark_id):
@@ -138,8 +201,7 @@ class BenchmarkRepository(Auth):
         ------
         benchengine.error.UnknownBenchmarkError
         """
-        sql = 'SELECT id FROM benchmark WHERE id = ?'
-        if self.con.execute(sql, (benchmark_id,)).fetchone() is None:
+        if self.con.execute(SQL_BENCHMARK_EXISTS, (benchmark_id,)).fetchone() is None:
             raise err.UnknownBenchmarkError(benchmark_id)
 
     def delete_benchmark(self, benchmark_id):
@@ -155,18 +217,24 @@ class BenchmarkRepository(Auth):
         ------
         benchengine.error.UnknownBenchmarkError
         """
-        # Ensure that the benchmark exists. Raises error if it does not exist.
-        self.assert_benchmark_exists(benchmark_id)
-        # Delete the workflow handle
-        self.template_store.delete_template(benchmark_id)
-        # Delete the benchmark record
-        sql = 'DELETE FROM benchmark WHERE id = ?'
-        self.con.execute(sql, (benchmark_id,))
+        # Delete the benchmark record first. If no record was deleted the
+        # benchmark does not exist and an error is raised without accessing
+        # the template store.
+        rowcount = self.con.execute(SQL_DELETE_BENCHMARK, (benchmark_id,)).rowcount
         self.con.commit()
+        if rowcount == 0:
+            raise err.UnknownBenchmarkError(benchmark_id)
+        # Delete the workflow handle and remove the benchmark from all caches
+        self.template_store.delete_template(benchmark_id)
+        self.template_cache.pop(benchmark_id, None)
+        self.benchmark_cache.pop(benchmark_id, None)
+        self.benchmark_list = None
 
     def get_benchmark(self, benchmark_id):
         """Get handle for the benchmark with the given identifier. Raises an
-        error if no benchmark with the identifier exists.
+        error if no benchmark with the identifier exists. Benchmark handles are
+        cached by the repository. The benchmark is looked up in the database
+        on every call to ensure that it has not been deleted.
 
         Parameters
         ----------
@@ -181,43 +249,104 @@ class BenchmarkRepository(Auth):
         ------
         benchengine.error.UnknownBenchmarkError
         """
-        # Get benchmark information from database. If the result is empty an
-        # error is raised
-        sql = 'SELECT id, name, description, instructions '
-        sql += 'FROM benchmark '
-        sql += 'WHERE id = ?'
-        bmark = self.con.execute(sql, (benchmark_id,)).fetchone()
+        # Get benchmark information from database. If the result is empty the
+        # benchmark may have been deleted by a different repository instance.
+        # Remove it from the caches and raise an error.
+        bmark = self.con.execute(SQL_GET_BENCHMARK, (benchmark_id,)).fetchone()
         if bmark is None:
+            self.template_cache.pop(benchmark_id, None)
+            self.benchmark_cache.pop(benchmark_id, None)
             raise err.UnknownBenchmarkError(benchmark_id)
+        # Return the cached handle if the benchmark has been accessed before
+        handle = self.benchmark_cache.get(benchmark_id)
+        if handle is not None:
+            return handle
+        name, description, instructions = bmark
         # Get workflow template for template repository
-        template = self.template_store.get_template(benchmark_id)
-        # Return handle for benchmark
-        return BenchmarkHandle(
+        template = self.get_template(benchmark_id)
+        # Create handle for benchmark and add it to the cache
+        handle = BenchmarkHandle(
             con=self.con,
             template=template,
-            name=bmark['name'],
-            description=bmark['description'],
-            instructions=bmark['instructions']
+            name=name,
+            description=description,
+            instructions=instructions
         )
+        self.benchmark_cache[benchmark_id] = handle
+        return handle
 
-    def list_benchmarks(self):
-        """Get a list of descriptors for all benchmarks in the repository.
+    def get_template(self, benchmark_id):
+        """Get the workflow template for the benchmark with the given
+        identifier. Templates are loaded from the template store on first
+        access and cached for subsequent calls.
+
+        Parameters
+        ----------
+        benchmark_id: string
+            Unique benchmark identifier
+
+        Returns
+        -------
+        benchtmpl.workflow.benchmark.base.BenchmarkTemplate
+        """
+        template = self.template_cache.get(benchmark_id)
+        if template is None:
+            template = self.template_store.get_template(benchmark_id)
+            self.template_cache[benchmark_id] = template
+        return template
+
+    def list_benchmarks(self, eager=False):
+        """Get a list of descriptors for all benchmarks in the repository. If
+        the eager flag is True the result is a list of benchmark handles with
+        their workflow templates loaded (from the template cache) instead.
+
+        The list of benchmark descriptors is cached by the repository until a
+        benchmark is added or deleted or the listing time-to-live expires. The
+        eager listing always queries the database. Handles for benchmarks that
+        no longer exist are removed from the cache.
+
+        Parameters
+        ----------
+        eager: bool, optional
+            Return benchmark handles including the workflow template if True
 
         Returns
         -------
         list(benchengine.benchmark.base.BenchmarkDescriptor)
         """
-        sql = 'SELECT id, name, description, instructions '
-        sql += 'FROM benchmark '
-        rs = self.con.execute(sql)
-        result = list()
-        for bmark in rs:
-            result.append(
+        if eager:
+            handles = dict()
+            rs = self.con.execute(SQL_LIST_BENCHMARKS)
+            for b_id, name, description, instructions in rs:
+                handle = self.benchmark_cache.get(b_id)
+                if handle is None:
+                    handle = BenchmarkHandle(
+                        con=self.con,
+                        template=self.get_template(b_id),
+                        name=name,
+                        description=description,
+                        instructions=instructions
+                    )
+                handles[b_id] = handle
+            # Replace the cached handles and templates with those for the
+            # current set of benchmarks.
+            self.benchmark_cache = handles
+            self.template_cache = {
+                b_id: handle.template for b_id, handle in handles.items()
+            }
+            return list(handles.values())
+        now = time.time()
+        if self.benchmark_list is None or self.benchmark_list_expires <= now:
+            rs = self.con.execute(SQL_LIST_BENCHMARKS)
+            self.benchmark_list = [
                 BenchmarkDescriptor(
-                    identifier=bmark['id'],
-                    name=bmark['name'],
-                    description=bmark['description'],
-                    instructions=bmark['instructions']
-                )
-            )
-        return result
+                    identifier=b_id,
+                    name=name,
+                    description=description,
+                    instructions=instructions
+                ) for b_id, name, description, instructions in rs
+            ]
+            self.benchmark_list_expires = now + self.listing_ttl
+        # Return a copy of the cached listing to protect it against
+        # modifications by the caller
+        return list(self.benchmark_list)
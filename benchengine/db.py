@@ -62,6 +62,9 @@ class DatabaseDriver(object):
             util.create_dir(os.path.dirname(f_name))
             con = sqlite3.connect(f_name, detect_types=sqlite3.PARSE_DECLTYPES)
             con.row_factory = sqlite3.Row
+            # Use write-ahead logging to allow readers on other connections to
+            # proceed while a write transaction is in progress
+            con.execute('PRAGMA journal_mode=WAL')
             return con
         else:
             raise ValueError('invalid connect string \'{}\''.format(connect_string))
@@ -12,16 +12,147 @@ in this module also contains the required methods to authorize that a given
 user can execute a requested action.
 """
 
-import dateutil.parser
 import datetime as dt
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
 
-from passlib.hash import pbkdf2_sha256
+from collections import OrderedDict
+from passlib.context import CryptContext
 
 from benchengine.user.base import RegisteredUser
 
 import benchengine.config as config
 import benchengine.error as err
-import benchtmpl.util.core as util
+
+
+"""SQL statements that are used to authenticate users and to maintain their API
+keys. Statements are defined once at module level to avoid re-building the
+query strings on every call.
+"""
+SQL_AUTHENTICATE = (
+    'SELECT u.id as id, u.email as email, k.expires as expires '
+    'FROM registered_user u, user_key k '
+    'WHERE u.id = k.user_id AND u.active = 1 AND k.api_key = ?'
+)
+SQL_DELETE_API_KEY = 'DELETE FROM user_key WHERE api_key = ?'
+SQL_DELETE_USER_KEYS = 'DELETE FROM user_key WHERE user_id = ?'
+SQL_GET_CREDENTIALS = (
+    'SELECT id, secret FROM registered_user '
+    'WHERE email = ? AND active = 1'
+)
+SQL_INSERT_API_KEY = (
+    'INSERT INTO user_key(user_id, api_key, expires) VALUES(?, ?, ?)'
+)
+SQL_UPDATE_SECRET = 'UPDATE registered_user SET secret = ? WHERE id = ?'
+
+"""Context for hashing and verifying user passwords. New passwords are hashed
+using argon2id. Password hashes that were created using pbkdf2_sha256 are still
+verified. They are deprecated and replaced by an argon2id hash when the user
+logs in the next time.
+"""
+PASSWORD_CONTEXT = CryptContext(
+    schemes=['argon2', 'pbkdf2_sha256'],
+    deprecated='auto',
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=1
+)
+
+"""Password hash that is verified when a login is attempted for an unknown or
+inactive user. Ensures that failed logins for unknown users take as long as
+failed logins for known users, i.e., the response time does not reveal whether
+a user exists. The hash uses the same parameters as PASSWORD_CONTEXT. The
+password for the hash is an unknown random string.
+
+This only holds for users whose password hash uses argon2id. Verifying one of
+the deprecated pbkdf2_sha256 hashes takes a different amount of time. Until
+these users have logged in once (and their hash has been replaced), the
+response time for a failed login may reveal that the account exists and has
+not been migrated yet. There is no single dummy hash that matches both schemes.
+"""
+DUMMY_SECRET = (
+    '$argon2id$v=19$m=65536,t=2,p=1$GuMcQ4jRmjMG4JzzvhcihA'
+    '$rHM3l5Zd+XZ5z4hPx8VpM1fRP1wo5wktzqWIjj+YIkg'
+)
+
+"""Cache for successfully verified user credentials. Verifying a password
+against the stored (deliberately expensive) password hash dominates the cost
+of a login. Credentials are cached as pairs of the stored password hash and an
+HMAC of the password that uses a random key which is generated when the module
+is loaded. Plain text passwords are never kept in memory. Since the stored hash
+changes whenever a user password is reset, cached entries for old passwords
+are never matched again. The cache is bounded and discards the least recently
+used entries first. Entries expire CREDENTIAL_CACHE_TTL seconds after the
+password was verified. Afterwards the password is verified against the stored
+hash again, i.e., a captured password cannot be used indefinitely without
+paying the cost of the hash verification.
+"""
+CREDENTIAL_CACHE_SIZE = 1024
+CREDENTIAL_CACHE_TTL = 60
+CREDENTIAL_KEY = os.urandom(32)
+credential_cache = OrderedDict()
+credential_cache_lock = threading.Lock()
+
+
+def get_expiry(value):
+    """Get the expiry time for an API key or a password reset request as
+    seconds since the epoch. Databases that were created before expiry times
+    were stored as integers may contain ISO timestamp strings. These values
+    cannot be converted and the result is None, i.e., the key or request is
+    treated as expired.
+
+    Parameters
+    ----------
+    value: int or string
+        Expiry time as stored in the database
+
+    Returns
+    -------
+    int
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def verify_password(password, secret):
+    """Verify that the given plain text password matches the stored password
+    hash. Successful verifications are cached for CREDENTIAL_CACHE_TTL
+    seconds.
+
+    Parameters
+    ----------
+    password: string
+        Plain text password
+    secret: string
+        Stored password hash
+
+    Returns
+    -------
+    bool
+    """
+    digest = hmac.new(CREDENTIAL_KEY, password.encode('utf-8'), hashlib.sha256)
+    key = (secret, digest.digest())
+    with credential_cache_lock:
+        verified_at = credential_cache.get(key)
+        if verified_at is not None:
+            if time.monotonic() - verified_at < CREDENTIAL_CACHE_TTL:
+                credential_cache.move_to_end(key)
+                return True
+            del credential_cache[key]
+    if not PASSWORD_CONTEXT.verify(password, secret):
+        return False
+    with credential_cache_lock:
+        credential_cache[key] = time.monotonic()
+        credential_cache.move_to_end(key)
+        if len(credential_cache) > CREDENTIAL_CACHE_SIZE:
+            credential_cache.popitem(last=False)
+    return True
 
 
 class Auth(object):
@@ -44,7 +175,7 @@ class Auth(object):
             Specifies the period (in seconds) for which a user API key is valid
         """
         self.con = con
-        if not login_timeout is None:
+        if login_timeout is not None:
             self.login_timeout = login_timeout
         else:
             self.login_timeout = config.get_login_timeout()
@@ -63,19 +194,18 @@ class Auth(object):
         # Get information for user that that is associated with the API key
         # together with the expiry date of the key. If the API key is unknown
         # or expired raise an error.
-        sql = 'SELECT u.id as id, u.email as email, k.expires as expires '
-        sql += 'FROM registered_user u, user_key k '
-        sql += 'WHERE u.id = k.user_id AND u.active = 1 AND k.api_key = ?'
-        user = self.con.execute(sql, (api_key,)).fetchone()
+        # The expiry date is stored as seconds since the epoch. Keys with an
+        # expiry date in an outdated format are treated as expired.
+        user = self.con.execute(SQL_AUTHENTICATE, (api_key,)).fetchone()
         if user is None:
             raise err.UnauthenticatedAccessError()
-        expires = dateutil.parser.parse(user['expires'])
-        if expires < dt.datetime.now():
+        expires = get_expiry(user['expires'])
+        if expires is None or expires < time.time():
             raise err.UnauthenticatedAccessError()
         return RegisteredUser(
             identifier=user['id'],
             email=user['email'],
-            valid_until=expires
+            valid_until=dt.datetime.fromtimestamp(expires)
         )
 
     def close(self):
@@ -103,7 +233,7 @@ class Auth(object):
         sql += 'WHERE m.team_id = p.team_id AND '
         sql += 'm.user_id = ? AND m.team_id = ? AND p.comp_id = ?'
         rs = self.con.execute(sql, (user_id, team_id, comp_id)).fetchone()
-        return not rs is None
+        return rs is not None
 
     def is_owner_of_competing_team(self, user_id, team_id, comp_id):
         """Test if a user is the owner of a given team and that team is
@@ -126,7 +256,7 @@ class Auth(object):
         sql += 'WHERE t.id = p.team_id AND '
         sql += 't.owner_id = ? AND t.id = ? AND p.comp_id = ?'
         rs = self.con.execute(sql, (user_id, team_id, comp_id)).fetchone()
-        return not rs is None
+        return rs is not None
 
     def is_team_member(self, user_id, team_id):
         """Test if a user is member of a given team. The result is True if the
@@ -143,14 +273,13 @@ class Auth(object):
         -------
         bool
         """
-        sql = 'SELECT user_id AS id FROM team_member WHERE team_id = ?'
-        users = self.con.execute(sql, (team_id,)).fetchall()
-        if users is None or len(users) == 0:
+        # Look up the membership directly. If the user is not a member of the
+        # team, check whether the team has any members at all (i.e., exists).
+        sql = 'SELECT user_id FROM team_member WHERE team_id = ? AND user_id = ?'
+        if self.con.execute(sql, (team_id, user_id)).fetchone() is not None:
             return True
-        for user in users:
-            if user['id'] == user_id:
-                return True
-        return False
+        sql = 'SELECT user_id FROM team_member WHERE team_id = ? LIMIT 1'
+        return self.con.execute(sql, (team_id,)).fetchone() is None
 
 
     def is_team_owner(self, user_id, team_id):
@@ -199,27 +328,34 @@ class Auth(object):
         benchengine.user.error.UnknownUserError
         """
         # Get the unique user identifier and encrypted password. Raise error
-        # if user is unknown
-        sql = 'SELECT id, secret FROM registered_user '
-        sql += 'WHERE email = ? AND active = 1'
-        user = self.con.execute(sql, (username,)).fetchone()
+        # if user is unknown. Verify the password against a dummy hash first
+        # to avoid revealing that the user does not exist (see DUMMY_SECRET
+        # for the limitation regarding users with pbkdf2_sha256 hashes).
+        user = self.con.execute(SQL_GET_CREDENTIALS, (username,)).fetchone()
         if user is None:
+            PASSWORD_CONTEXT.verify(password, DUMMY_SECRET)
             raise err.UnknownUserError(username)
         # Validate that given credentials match the stored user secret
-        if not pbkdf2_sha256.verify(password, user['secret']):
+        if not verify_password(password, user['secret']):
             raise err.UnknownUserError(username)
         user_id = user['id']
-        # Remove any API key that may be associated with the user currently
-        sql = 'DELETE FROM user_key WHERE user_id = ?'
-        self.con.execute(sql, (user_id,))
-        # Create a new API key for the user and set the expiry date. The key
-        # expires login_timeout seconds from now.
-        api_key = util.get_unique_identifier()
-        expires = dt.datetime.now() + dt.timedelta(seconds=self.login_timeout)
-        # Insert API key and expiry date into database and return the key
-        sql = 'INSERT INTO user_key(user_id, api_key, expires) VALUES(?, ?, ?)'
-        self.con.execute(sql, (user_id, api_key, expires.isoformat()))
-        self.con.commit()
+        # Create a new random API key for the user and set the expiry date. The
+        # key expires login_timeout seconds from now. The expiry date is stored
+        # as seconds since the epoch.
+        api_key = secrets.token_urlsafe(32)
+        expires = int(time.time()) + self.login_timeout
+        # Replace any API key that may be associated with the user currently
+        # by the new key within a single transaction. Replace password hashes
+        # that use a deprecated hashing scheme as part of the same transaction.
+        with self.con:
+            if PASSWORD_CONTEXT.needs_update(user['secret']):
+                secret = PASSWORD_CONTEXT.hash(password)
+                self.con.execute(SQL_UPDATE_SECRET, (secret, user_id))
+            self.con.execute(SQL_DELETE_USER_KEYS, (user_id,))
+            self.con.execute(
+                SQL_INSERT_API_KEY,
+                (user_id, api_key, expires)
+            )
         return api_key
 
     def logout(self, api_key):
@@ -231,5 +367,5 @@ class Auth(object):
         api_key: string
             Unique API key assigned at login
         """
-        self.con.execute('DELETE FROM user_key WHERE api_key = ?', (api_key,))
-        self.con.commit()
+        with self.con:
+            self.con.execute(SQL_DELETE_API_KEY, (api_key,))
@@ -18,7 +18,12 @@ class RegisteredUser(object):
     """Each user that registers with the application has a unique identifier
     and email associated with them. The valid until date contains the time
     until the current API key for the user expires.
+
+    User objects are created for every authenticated request. The class uses
+    slots to avoid the overhead of a per-instance attribute dictionary.
     """
+    __slots__ = ('identifier', 'email', 'valid_until')
+
     def __init__(self, identifier, email, valid_until=None):
         """Initialize the user properties.
 
@@ -42,7 +47,7 @@ class RegisteredUser(object):
         -------
         bool
         """
-        return not self.valid_until is None and self.valid_until >= dt.datetime.now()
+        return self.valid_until is not None and self.valid_until >= dt.datetime.now()
 
     @property
     def username(self):
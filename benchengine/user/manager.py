@@ -10,12 +10,10 @@
 reset requests.
 """
 
-import dateutil.parser
 import datetime as dt
+import time
 
-from passlib.hash import pbkdf2_sha256
-
-from benchengine.user.auth import Auth
+from benchengine.user.auth import Auth, PASSWORD_CONTEXT, get_expiry
 from benchengine.user.base import RegisteredUser
 
 import benchengine.error as err
@@ -45,8 +43,8 @@ class UserManager(Auth):
             Unique user identifier
         """
         sql = 'UPDATE registered_user SET active = 1 WHERE id = ?'
-        self.con.execute(sql, (user_id,))
-        self.con.commit()
+        with self.con:
+            self.con.execute(sql, (user_id,))
 
     def get_user(self, username):
         """Get handle for user with the given user name.
@@ -87,11 +85,9 @@ class UserManager(Auth):
         sql += 'ON (u.id = k.user_id) WHERE u.active = 1'
         users = list()
         for user in self.con.execute(sql):
-            expires = user['expires']
-            if not expires is None:
-                expires = dateutil.parser.parse(expires)
-            else:
-                expires = None
+            expires = get_expiry(user['expires'])
+            if expires is not None:
+                expires = dt.datetime.fromtimestamp(expires)
             users.append(
                 RegisteredUser(
                     identifier=user['id'],
@@ -136,17 +132,17 @@ class UserManager(Auth):
         self.validate_password(password)
         # If a user with the given username already exists raise an error
         sql = 'SELECT id FROM registered_user WHERE email = ?'
-        if not self.con.execute(sql, (username,)).fetchone() is None:
+        if self.con.execute(sql, (username,)).fetchone() is not None:
             raise err.DuplicateUserError(username)
         # Insert new user into database after creating an unique user identifier
         # and the password hash.
         user_id = util.get_unique_identifier()
-        hash = pbkdf2_sha256.hash(password.strip())
+        hash = PASSWORD_CONTEXT.hash(password.strip())
         active = 0 if verify else 1
         sql = 'INSERT INTO registered_user(id, email, secret, active) '
         sql += 'VALUES(?, ?, ?, ?)'
-        self.con.execute(sql, (user_id, username, hash, active))
-        self.con.commit()
+        with self.con:
+            self.con.execute(sql, (user_id, username, hash, active))
         # Log user in after successful registration and return API key
         return user_id
 
@@ -175,15 +171,18 @@ class UserManager(Auth):
         if user is None:
             return request_id
         user_id = user['id']
-        # Delete any existing password reset request for the given user
-        sql = 'DELETE FROM password_request WHERE user_id = ?'
-        self.con.execute(sql, (user_id,))
         # Insert new password reset request. The expiry date for the request is
-        # calculated using the login timeout
-        expires = dt.datetime.now() + dt.timedelta(seconds=self.login_timeout)
-        sql = 'INSERT INTO password_request(user_id, request_id, expires) VALUES(?, ?, ?)'
-        self.con.execute(sql, (user_id, request_id, expires.isoformat()))
-        self.con.commit()
+        # calculated using the login timeout. The expiry date is stored as
+        # seconds since the epoch.
+        expires = int(time.time()) + self.login_timeout
+        # Replace any existing password reset request for the given user with
+        # the new request in a single transaction.
+        with self.con:
+            sql = 'DELETE FROM password_request WHERE user_id = ?'
+            self.con.execute(sql, (user_id,))
+            sql = 'INSERT INTO password_request(user_id, request_id, expires) '
+            sql += 'VALUES(?, ?, ?)'
+            self.con.execute(sql, (user_id, request_id, expires))
         return request_id
 
     def reset_password(self, request_id, password):
@@ -206,21 +205,21 @@ class UserManager(Auth):
         req = self.con.execute(sql, (request_id,)).fetchone()
         if req is None:
             raise err.UnknownResourceError(request_id, type='reset request')
-        expires = dateutil.parser.parse(req['expires'])
-        if expires < dt.datetime.now():
+        expires = get_expiry(req['expires'])
+        if expires is None or expires < time.time():
             raise err.UnknownResourceError(request_id, type='reset request')
-        # Update password hash for the identifier user
+        # Update password hash for the identifier user, invalidate all current
+        # API keys for the user, and remove the request within a single
+        # transaction.
         user_id = req['user_id']
-        hash = pbkdf2_sha256.hash(password.strip())
-        sql = 'UPDATE registered_user SET secret = ? WHERE id = ?'
-        self.con.execute(sql, (hash, user_id))
-        # Invalidate all current API keys for the user after password is updated
-        sql = 'DELETE FROM user_key WHERE user_id = ?'
-        self.con.execute(sql, (user_id,))
-         # Remove the request
-        sql = 'DELETE FROM password_request WHERE request_id = ?'
-        self.con.execute(sql, (request_id,))
-        self.con.commit()
+        hash = PASSWORD_CONTEXT.hash(password.strip())
+        with self.con:
+            sql = 'UPDATE registered_user SET secret = ? WHERE id = ?'
+            self.con.execute(sql, (hash, user_id))
+            sql = 'DELETE FROM user_key WHERE user_id = ?'
+            self.con.execute(sql, (user_id,))
+            sql = 'DELETE FROM password_request WHERE request_id = ?'
+            self.con.execute(sql, (request_id,))
 
     def validate_password(self, password):
         """Validate a given password. Raises constraint violation error if an
@@ -237,6 +236,6 @@ class UserManager(Auth):
         ------
         benchengine.error.ConstraintViolationError
         """
-        # Raise error if password is invalid
-        if password is None or len(password.strip()) == 0:
+        # Raise error if password is invalid, i.e., empty or only whitespace
+        if password is None or len(password) == 0 or password.isspace():
             raise err.ConstraintViolationError('empty password')
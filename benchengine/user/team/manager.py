@@ -55,19 +55,64 @@ class TeamManager(Auth):
         benchengine.error.UnknownTeamError
         benchengine.error.UnknownUserError
         """
-        # Validate that the team and user exist. Raises exception if either
-        #  does not exist.
-        self.assert_team_exists(team_id)
+        # Validate that the team exists and that the user is not alreay a
+        # member of the team using a single query. Raises exception if the team
+        # does not exist or the user is unknown.
+        sql = 'SELECT t.id AS id, m.user_id AS user_id '
+        sql += 'FROM team t LEFT OUTER JOIN team_member m '
+        sql += 'ON (t.id = m.team_id AND m.user_id = ?) '
+        sql += 'WHERE t.id = ?'
+        team = self.con.execute(sql, (user_id, team_id)).fetchone()
+        if team is None:
+            raise err.UnknownTeamError(team_id)
         self.assert_user_exists(user_id)
-        # Ensure that the user is not alreay a member of the team
-        sql = 'SELECT * FROM team_member WHERE team_id = ? AND user_id = ?'
-        if not self.con.execute(sql, (team_id, user_id)).fetchone() is None:
+        if team['user_id'] is not None:
             raise err.DuplicateUserError(user_id)
         # Add team member and commit changes
         sql = 'INSERT INTO team_member(team_id, user_id) VALUES(?, ?)'
         self.con.execute(sql, (team_id, user_id))
         self.con.commit()
 
+    def add_members(self, team_id, user_ids):
+        """Add a list of new members to the given team. All members are
+        validated first and then inserted using a single batch statement within
+        one transaction. If any of the users is unknown or already a member of
+        the team no member is added.
+
+        Parameters
+        ----------
+        team_id: string
+            Unique team identifier
+        user_ids: list(string)
+            List of unique user identifier
+
+        Raises
+        ------
+        benchengine.error.DuplicateUserError
+        benchengine.error.UnknownTeamError
+        benchengine.error.UnknownUserError
+        """
+        # Validate that the team and all users exist. Raises exception if
+        # either does not exist.
+        self.assert_team_exists(team_id)
+        sql = 'SELECT user_id FROM team_member WHERE team_id = ?'
+        member_ids = set(row['user_id'] for row in self.con.execute(sql, (team_id,)))
+        rows = list()
+        for user_id in user_ids:
+            self.assert_user_exists(user_id)
+            # Ensure that the user is not alreay a member of the team (or
+            # listed more than once)
+            if user_id in member_ids:
+                raise err.DuplicateUserError(user_id)
+            member_ids.add(user_id)
+            rows.append((team_id, user_id))
+        # Add all team members within a single transaction
+        with self.con:
+            self.con.executemany(
+                'INSERT INTO team_member(team_id, user_id) VALUES(?, ?)',
+                rows
+            )
+
     def assert_team_exists(self, team_id):
         """Ensure that a team with the given identifier exists. If the team
         does not exist an UnknownTeam exception is raised.
@@ -118,6 +163,9 @@ class TeamManager(Auth):
         to be a team member. Otherwise, the user is required to be the team
         owner.
 
+        If a role is given an unknown team error is raised if the team does
+        not exist.
+
         Parameters
         ----------
         access_token: string
@@ -137,15 +185,27 @@ class TeamManager(Auth):
         ------
         benchengine.error.UnauthenticatedAccessError
         benchengine.error.UnauthorizedAccessError
+        benchengine.error.UnknownTeamError
         """
         # Get user identifier
         user_id = self.authenticate(access_token).identifier
+        if role is None:
+            return user_id
+        # Get the team owner and the team membership of the user with a single
+        # query. Raise an error if the team does not exist.
+        sql = 'SELECT t.owner_id AS owner_id, m.user_id AS member_id '
+        sql += 'FROM team t LEFT OUTER JOIN team_member m '
+        sql += 'ON (t.id = m.team_id AND m.user_id = ?) '
+        sql += 'WHERE t.id = ?'
+        team = self.con.execute(sql, (user_id, team_id)).fetchone()
+        if team is None:
+            raise err.UnknownTeamError(team_id)
         # Ensure that the user has the required role
         if role == OWNER or (role == OWNER_OR_SELF and user_id != member_id):
-            if not self.is_team_owner(user_id=user_id, team_id=team_id):
+            if team['owner_id'] != user_id:
                 raise err.UnauthorizedAccessError()
         elif role == MEMBER or (role == OWNER_OR_SELF and user_id == member_id):
-            if not self.is_team_member(user_id=user_id, team_id=team_id):
+            if team['member_id'] is None:
                 raise err.UnauthorizedAccessError()
         return user_id
 
@@ -172,12 +232,11 @@ class TeamManager(Auth):
         benchengine.error.UnknownUserError
         """
         # Ensure that the owner exists and all team members exist. Will raise
-        # exception if user is unknown.
-        self.assert_user_exists(owner_id)
-        if not members is None:
-            for user_id in set(members):
-                if not user_id == owner_id:
-                    self.assert_user_exists(user_id)
+        # exception if user is unknown. The set of member identifiers always
+        # contains the team owner.
+        member_ids = frozenset((owner_id, *(members or ())))
+        for user_id in member_ids:
+            self.assert_user_exists(user_id)
         # Ensure that the given team name is uniqe and does not contain too many
         # characters
         sql = 'SELECT * FROM team WHERE name = ?'
@@ -185,31 +244,29 @@ class TeamManager(Auth):
             raise err.ConstraintViolationError('missing team name')
         elif len(name.strip()) > 255:
             raise err.ConstraintViolationError('team name contains more than 255 character')
-        elif not self.con.execute(sql, (name.strip(),)).fetchone() is None:
+        elif self.con.execute(sql, (name.strip(),)).fetchone() is not None:
             raise err.ConstraintViolationError('team name \'{}\' exists'.format(name.strip()))
         # Get unique identifier for the new team.
         team_id = util.get_unique_identifier()
         # Create the new team and add team members. Ensure that at least the
-        # team owner is added as a team member.
-        sql = 'INSERT INTO team_member(team_id, user_id) VALUES(?, ?)'
-        self.con.execute(
-            'INSERT INTO team(id, name, owner_id) VALUES(?, ?, ?)',
-            (team_id, name.strip(), owner_id)
-        )
-        self.con.execute(sql, (team_id, owner_id))
-        member_count = 1
-        if not members is None:
-            for user_id in set(members):
-                if not user_id == owner_id:
-                    self.con.execute(sql, (team_id, user_id))
-                    member_count += 1
-        self.con.commit()
+        # team owner is added as a team member. All members are inserted using
+        # a single batch statement. Team and members are inserted within a
+        # single transaction.
+        with self.con:
+            self.con.execute(
+                'INSERT INTO team(id, name, owner_id) VALUES(?, ?, ?)',
+                (team_id, name.strip(), owner_id)
+            )
+            self.con.executemany(
+                'INSERT INTO team_member(team_id, user_id) VALUES(?, ?)',
+                [(team_id, user_id) for user_id in member_ids]
+            )
         # Return team descriptor
         return TeamDescriptor(
             identifier=team_id,
             name=name,
             owner_id=owner_id,
-            member_count=member_count
+            member_count=len(member_ids)
         )
 
     def delete_team(self, team_id):
@@ -252,20 +309,24 @@ class TeamManager(Auth):
         ------
         benchengine.error.UnknownTeamError
         """
-        # Get team information. Raise error if no team with given identifier
-        # exists
-        sql = 'SELECT name, owner_id FROM team WHERE id = ?'
-        team = self.con.execute(sql, (team_id,)).fetchone()
+        # Get team information together with the handles for all team members
+        # in a single query. Raise error if no team with given identifier
+        # exists.
+        sql = 'SELECT t.name AS name, t.owner_id AS owner_id, '
+        sql += 'u.id AS user_id, u.email AS email '
+        sql += 'FROM team t '
+        sql += 'LEFT OUTER JOIN team_member m ON (t.id = m.team_id) '
+        sql += 'LEFT OUTER JOIN registered_user u ON (m.user_id = u.id) '
+        sql += 'WHERE t.id = ?'
+        team = None
+        members = dict()
+        for row in self.con.execute(sql, (team_id,)):
+            team = row
+            if row['user_id'] is not None:
+                user = RegisteredUser(identifier=row['user_id'], email=row['email'])
+                members[user.identifier] = user
         if team is None:
             raise err.UnknownTeamError(team_id)
-        # Get handles for team members
-        members = dict()
-        sql = 'SELECT u.id, u.email '
-        sql += 'FROM registered_user u, team_member t '
-        sql += 'WHERE u.id = t.user_id AND t.team_id = ?'
-        for row in self.con.execute(sql, (team_id,)).fetchall():
-            user = RegisteredUser(identifier=row['id'], email=row['email'])
-            members[user.identifier] = user
         return TeamHandle(
             identifier=team_id,
             name=team['name'],
@@ -296,7 +357,7 @@ class TeamManager(Auth):
         # Depending on whether the user id is given the teams are either
         # taken directly from the teams table of a sub-query that filters
         # teams that the user is member of.
-        if not user_id is None:
+        if user_id is not None:
             team_table = 'SELECT id, name, owner_id FROM team t1, team_member m1 '
             team_table += 'WHERE t1.id = m1.team_id AND m1.user_id = ?'
             team_table = '(' + team_table + ')'
@@ -305,17 +366,14 @@ class TeamManager(Auth):
             team_table = 'team'
             bindings = ()
         sql = sql.format(team_table)
-        result = list()
-        for team in self.con.execute(sql, bindings).fetchall():
-            result.append(
-                TeamDescriptor(
-                    identifier=team['id'],
-                    name=team['name'],
-                    owner_id=team['owner_id'],
-                    member_count=team['member']
-                )
-            )
-        return result
+        return [
+            TeamDescriptor(
+                identifier=team['id'],
+                name=team['name'],
+                owner_id=team['owner_id'],
+                member_count=team['member']
+            ) for team in self.con.execute(sql, bindings)
+        ]
 
     def remove_member(self, team_id, user_id):
         """Remove the given user as member of the given team. Raises error if
@@ -367,17 +425,19 @@ class TeamManager(Auth):
         benchengine.error.ConstraintViolationError
         benchengine.error.UnknownTeamError
         """
-        # Ensure that the team exists. Raises error if team does not exist.
-        self.assert_team_exists(team_id)
-        # Ensure that no other team has the same name
+        # Ensure that no other team has the same name. Team names are stored
+        # without leading and trailing whitespaces (as in create_team).
+        name = name.strip()
         sql = 'SELECT * FROM team WHERE id <> ? AND name = ?'
-        if len(name.strip()) > 255:
+        if len(name) > 255:
             raise err.ConstraintViolationError('team name contains more than 255 character')
-        elif not self.con.execute(sql, (team_id, name)).fetchone() is None:
-            raise err.ConstraintViolationError('team name \'{}\' exists'.format(name.strip()))
-        # Update the team name
+        elif self.con.execute(sql, (team_id, name)).fetchone() is not None:
+            raise err.ConstraintViolationError('team name \'{}\' exists'.format(name))
+        # Update the team name. The team does not exist if no row was updated.
+        # This avoids a separate query to check that the team exists.
         sql = 'UPDATE team SET name = ? WHERE id = ?'
-        self.con.execute(sql, (name, team_id))
-        self.con.commit()
+        with self.con:
+            if self.con.execute(sql, (name, team_id)).rowcount == 0:
+                raise err.UnknownTeamError(team_id)
         # Return the handle for the team
         return self.get_team(team_id)
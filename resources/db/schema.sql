@@ -26,8 +26,8 @@ CREATE TABLE registered_user(
 --
 CREATE TABLE user_key(
     user_id CHAR(32) NOT NULL REFERENCES registered_user (id),
-    api_key CHAR(32) NOT NULL,
-    expires CHAR(26) NOT NULL,
+    api_key VARCHAR(64) NOT NULL,
+    expires INTEGER NOT NULL,
     PRIMARY KEY(user_id),
     UNIQUE (api_key)
 );
@@ -38,7 +38,7 @@ CREATE TABLE user_key(
 CREATE TABLE password_request(
     user_id CHAR(32) NOT NULL REFERENCES registered_user (id),
     request_id CHAR(32) NOT NULL,
-    expires CHAR(26) NOT NULL,
+    expires INTEGER NOT NULL,
     PRIMARY KEY(user_id),
     UNIQUE (request_id)
 );
@@ -91,3 +91,8 @@ CREATE TABLE team_member(
     user_id CHAR(32) NOT NULL REFERENCES registered_user (id),
     PRIMARY KEY(team_id, user_id)
 );
+
+--
+-- Index to list the teams that a user is a member of
+--
+CREATE INDEX team_member_user_idx ON team_member(user_id);
@@ -2,9 +2,7 @@ from setuptools import setup, find_packages
 
 
 install_requires=[
-    'future',
-    'passlib',
-    'python-dateutil',
+    'passlib[argon2]',
     'pyyaml>=5.1',
     'benchmark-templates>=0.2.0'
 ]
@@ -40,11 +38,10 @@ setup(
     extras_require=extras_require,
     tests_require=tests_require,
     install_requires=install_requires,
+    python_requires='>=3.6',
     classifiers=[
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
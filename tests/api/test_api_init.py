@@ -65,6 +65,20 @@ class TestApiInit(TestCase):
         # Make sure to close the database connesction
         api.close()
 
+    def test_remove_team_members(self):
+        """Test generating Urls to remove multiple team members."""
+        urls = UrlFactory(base_url='http://some.url/api/')
+        user_ids = ['0000', '0001', '0002']
+        remove_urls = urls.remove_team_members('T0', user_ids)
+        self.assertEqual(len(remove_urls), 3)
+        for user_id in user_ids:
+            self.assertEqual(
+                remove_urls[user_id],
+                urls.remove_team_member('T0', user_id)
+            )
+        # Empty list of users
+        self.assertEqual(urls.remove_team_members('T0', list()), dict())
+
     def test_url_factory_init(self):
         """Test initializing the ulr factory with and without arguments."""
         os.environ[config.ENV_APIURL] = 'http://my.app/api'
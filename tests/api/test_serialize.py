@@ -0,0 +1,152 @@
+"""Test serializers for API resources."""
+
+from unittest import TestCase
+
+from benchengine.api.route import UrlFactory
+from benchengine.api.serialize.base import LINK_CACHE_SIZE
+from benchengine.api.serialize.benchmark import BenchmarkSerializer
+from benchengine.api.serialize.team import TeamSerializer
+from benchengine.api.serialize.user import UserSerializer
+from benchengine.benchmark.base import BenchmarkDescriptor, BenchmarkHandle
+from benchengine.user.base import RegisteredUser
+from benchengine.user.team.base import TeamDescriptor
+from benchtmpl.workflow.benchmark.base import BenchmarkTemplate
+from benchtmpl.workflow.benchmark.schema import BenchmarkResultColumn
+from benchtmpl.workflow.benchmark.schema import BenchmarkResultSchema
+
+import benchengine.api.serialize.hateoas as hateoas
+import benchengine.api.serialize.labels as labels
+import benchtmpl.workflow.parameter.declaration as pd
+
+
+BASE_URL = 'http://my.app/api'
+
+
+class TestSerialize(TestCase):
+    """Test serializations that do not require an engine API instance."""
+    def test_benchmark_links(self):
+        """Test the bounded cache of benchmark descriptor links."""
+        urls = UrlFactory(base_url=BASE_URL)
+        serializer = BenchmarkSerializer(urls)
+        benchmark = BenchmarkDescriptor(identifier='B0', name='Benchmark')
+        doc = serializer.benchmark_descriptor(benchmark)
+        doc[labels.LINKS].pop()
+        links = hateoas.deserialize(
+            serializer.benchmark_descriptor(benchmark)[labels.LINKS]
+        )
+        self.assertEqual(len(links), 2)
+        self.assertEqual(links[hateoas.SELF], urls.get_benchmark('B0'))
+        # Fill the cache past its limit. The least recently used entry is
+        # discarded first.
+        for i in range(1, LINK_CACHE_SIZE + 1):
+            b = BenchmarkDescriptor(identifier='B{}'.format(i), name='B')
+            serializer.benchmark_descriptor(b)
+        self.assertEqual(len(serializer.benchmark_links), LINK_CACHE_SIZE)
+        self.assertFalse('B0' in serializer.benchmark_links)
+        self.assertTrue('B1' in serializer.benchmark_links)
+        # Serializing an evicted benchmark adds it to the cache again
+        links = hateoas.deserialize(
+            serializer.benchmark_descriptor(benchmark)[labels.LINKS]
+        )
+        self.assertEqual(links[hateoas.SELF], urls.get_benchmark('B0'))
+        self.assertEqual(len(serializer.benchmark_links), LINK_CACHE_SIZE)
+        self.assertFalse('B1' in serializer.benchmark_links)
+
+    def test_leaderboard_schema(self):
+        """Test that modifying the schema of a leaderboard serialization does
+        not affect later serializations.
+        """
+        schema = BenchmarkResultSchema(
+            columns=[
+                BenchmarkResultColumn('col1', 'Column 1', pd.DT_INTEGER),
+                BenchmarkResultColumn('col2', 'Column 2', pd.DT_STRING)
+            ],
+            result_file_id='results.json'
+        )
+        template = BenchmarkTemplate(
+            workflow_spec=dict(),
+            schema=schema,
+            identifier='B0'
+        )
+        benchmark = BenchmarkHandle(con=None, template=template, name='B')
+        serializer = BenchmarkSerializer(UrlFactory(base_url=BASE_URL))
+        doc = serializer.benchmark_leaderboard(benchmark, list())
+        self.assertEqual(len(doc[labels.SCHEMA]), 2)
+        doc[labels.SCHEMA][0][labels.NAME] = 'Modified'
+        doc[labels.SCHEMA].pop()
+        doc = serializer.benchmark_leaderboard(benchmark, list())
+        columns = [c[labels.NAME] for c in doc[labels.SCHEMA]]
+        self.assertEqual(columns, ['Column 1', 'Column 2'])
+        # The cache belongs to the serializer instance
+        self.assertTrue('B0' in serializer.schemas)
+        serializer = BenchmarkSerializer(UrlFactory(base_url=BASE_URL))
+        self.assertEqual(len(serializer.schemas), 0)
+
+    def test_team_links(self):
+        """Test the bounded cache of team descriptor links and removing the
+        entries for deleted teams.
+        """
+        urls = UrlFactory(base_url=BASE_URL)
+        serializer = TeamSerializer(urls)
+        team = TeamDescriptor(
+            identifier='T0',
+            name='Team',
+            owner_id='U0',
+            member_count=1
+        )
+        # Owner links include the delete link
+        doc = serializer.team_descriptor(team, user_id='U0')
+        links = hateoas.deserialize(doc[labels.LINKS])
+        self.assertEqual(len(links), 4)
+        self.assertEqual(links[hateoas.DELETE], urls.get_team('T0'))
+        doc[labels.LINKS].clear()
+        doc = serializer.team_descriptor(team, user_id='U0')
+        self.assertEqual(len(doc[labels.LINKS]), 4)
+        # Links for team members
+        doc = serializer.team_descriptor(team, user_id='U1')
+        links = hateoas.deserialize(doc[labels.LINKS])
+        self.assertEqual(len(links), 2)
+        self.assertFalse(hateoas.DELETE in links)
+        self.assertTrue(('T0', True) in serializer.team_links)
+        self.assertTrue(('T0', False) in serializer.team_links)
+        # Remove all entries for a deleted team
+        serializer.remove_team('T0')
+        self.assertFalse(('T0', True) in serializer.team_links)
+        self.assertFalse(('T0', False) in serializer.team_links)
+        serializer.remove_team('T0')
+        # Fill the cache past its limit
+        for i in range(LINK_CACHE_SIZE + 1):
+            t = TeamDescriptor(
+                identifier='T{}'.format(i),
+                name='Team',
+                owner_id='U0',
+                member_count=1
+            )
+            serializer.team_descriptor(t)
+        self.assertEqual(len(serializer.team_links), LINK_CACHE_SIZE)
+        self.assertFalse(('T0', True) in serializer.team_links)
+        self.assertTrue(('T1', True) in serializer.team_links)
+
+    def test_user_links(self):
+        """Test that modifying the links of a user serialization does not
+        affect later serializations.
+        """
+        urls = UrlFactory(base_url=BASE_URL)
+        serializer = UserSerializer(urls)
+        user = RegisteredUser(identifier='0000', email='alice@example.com')
+        doc = serializer.user(user)
+        doc[labels.LINKS].append(hateoas.reference('x', 'y'))
+        doc[labels.LINKS][0][labels.REF] = 'http://other.url'
+        links = hateoas.deserialize(serializer.user(user)[labels.LINKS])
+        self.assertEqual(len(links), 2)
+        self.assertEqual(links[hateoas.user(hateoas.LOGIN)], urls.login())
+        doc = serializer.login('mytoken')
+        doc[labels.LINKS].pop()
+        links = hateoas.deserialize(serializer.login('mytoken')[labels.LINKS])
+        self.assertEqual(len(links), 2)
+        self.assertTrue(hateoas.user(hateoas.LOGOUT) in links)
+
+
+if __name__ == '__main__':
+    import unittest
+    unittest.main()
@@ -146,3 +146,68 @@ class TestBenchmarkRepository(object):
         assert rs['max_line'] is None
         with pytest.raises(err.ConstraintViolationError):
             benchmark.insert_results('RUN4', {'max_len': 4, 'max_line': 'R4'})
+
+    def test_template_cache(self, tmpdir):
+        """Test caching of workflow templates in the benchmark repository."""
+        con = self.init(tmpdir)
+        repo = BenchmarkRepository(con=con)
+        benchmark = repo.add_benchmark(name='My benchmark', src_dir=TEMPLATE_DIR)
+        # The template of a new benchmark is added to the cache
+        template = repo.get_template(benchmark.identifier)
+        assert template is benchmark.template
+        assert repo.get_template(benchmark.identifier) is template
+        assert repo.get_benchmark(benchmark.identifier).template is template
+        benchmarks = repo.list_benchmarks(eager=True)
+        assert len(benchmarks) == 1
+        assert benchmarks[0].template is template
+        # Deleting the benchmark removes the template from the cache
+        repo.delete_benchmark(benchmark.identifier)
+        assert not benchmark.identifier in repo.template_cache
+
+    def test_benchmark_cache(self, tmpdir):
+        """Test caching of benchmark handles and benchmark listings."""
+        con = self.init(tmpdir)
+        repo = BenchmarkRepository(con=con)
+        bm_1 = repo.add_benchmark(name='First benchmark', src_dir=TEMPLATE_DIR)
+        assert repo.get_benchmark(bm_1.identifier) is bm_1
+        assert repo.list_benchmarks(eager=True)[0] is bm_1
+        benchmarks = repo.list_benchmarks()
+        assert len(benchmarks) == 1
+        # Modifying the returned list does not affect the cached listing
+        benchmarks.pop()
+        assert len(repo.list_benchmarks()) == 1
+        # Adding and deleting benchmarks invalidates the cached listing
+        bm_2 = repo.add_benchmark(name='Second benchmark', src_dir=TEMPLATE_DIR)
+        assert len(repo.list_benchmarks()) == 2
+        repo.delete_benchmark(bm_1.identifier)
+        assert [b.identifier for b in repo.list_benchmarks()] == [bm_2.identifier]
+        assert not bm_1.identifier in repo.benchmark_cache
+        with pytest.raises(err.UnknownBenchmarkError):
+            repo.get_benchmark(bm_1.identifier)
+
+    def test_shared_database(self, tmpdir):
+        """Test that cached benchmarks are not served after they were added or
+        deleted by a different repository instance for the same database.
+        """
+        con = self.init(tmpdir)
+        server = BenchmarkRepository(con=con, listing_ttl=0)
+        admin = BenchmarkRepository(con=con)
+        assert len(server.list_benchmarks()) == 0
+        benchmark = admin.add_benchmark(name='My benchmark', src_dir=TEMPLATE_DIR)
+        assert len(server.list_benchmarks()) == 1
+        assert len(server.list_benchmarks(eager=True)) == 1
+        handle = server.get_benchmark(benchmark.identifier)
+        assert server.get_benchmark(benchmark.identifier) is handle
+        admin.delete_benchmark(benchmark.identifier)
+        with pytest.raises(err.UnknownBenchmarkError):
+            server.get_benchmark(benchmark.identifier)
+        assert not benchmark.identifier in server.benchmark_cache
+        assert len(server.list_benchmarks()) == 0
+        assert len(server.list_benchmarks(eager=True)) == 0
+        # The listing snapshot is refreshed after the time-to-live expires
+        server = BenchmarkRepository(con=con, listing_ttl=3600)
+        assert len(server.list_benchmarks()) == 0
+        admin.add_benchmark(name='My benchmark', src_dir=TEMPLATE_DIR)
+        assert len(server.list_benchmarks()) == 0
+        server.benchmark_list_expires = 0
+        assert len(server.list_benchmarks()) == 1
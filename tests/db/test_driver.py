@@ -65,6 +65,8 @@ class TestDatabaseDriver(object):
         # and SQL error
         con = DatabaseDriver.connect()
         assert con.execute('SELECT * from team').fetchone() is None
+        # SQLite connections use write-ahead logging
+        assert con.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
         con.close()
 
     def validate_database(self, con, filename):
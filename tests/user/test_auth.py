@@ -15,9 +15,10 @@ import time
 from passlib.hash import pbkdf2_sha256
 
 from benchengine.db import DatabaseDriver
-from benchengine.user.auth import Auth
+from benchengine.user.auth import Auth, verify_password
 
 import benchengine.error as err
+import benchengine.user.auth as auth_module
 import benchtmpl.util.core as util
 
 
@@ -82,6 +83,22 @@ class TestUserAuthentication(object):
         with pytest.raises(err.UnknownUserError):
             auth.login(USER_3, USER_3)
 
+    def test_legacy_expiry(self, tmpdir):
+        """Test that API keys with an expiry date in ISO format (as written
+        by previous versions) are treated as expired.
+        """
+        con = self.connect(tmpdir)
+        auth = Auth(con)
+        api_key = auth.login(USER_1, USER_1)
+        sql = 'UPDATE user_key SET expires = ? WHERE api_key = ?'
+        con.execute(sql, ('2019-08-29T10:00:00.000000', api_key))
+        con.commit()
+        with pytest.raises(err.UnauthenticatedAccessError):
+            auth.authenticate(api_key)
+        # Logging in again replaces the outdated key
+        api_key = auth.login(USER_1, USER_1)
+        assert auth.authenticate(api_key).identifier == USER_1
+
     def test_login_timeout(self, tmpdir):
         """Test login after key expired."""
         # Set login timeout to one second
@@ -100,3 +117,59 @@ class TestUserAuthentication(object):
         auth = Auth(self.connect(tmpdir))
         assert auth.is_team_owner(team_id='unknown', user_id=USER_1)
         assert auth.is_team_member(team_id='unknown', user_id=USER_1)
+
+    def test_verify_password(self):
+        """Test caching of verified user credentials."""
+        secret = pbkdf2_sha256.hash('mypwd')
+        assert verify_password('mypwd', secret)
+        assert len([k for k in auth_module.credential_cache if k[0] == secret]) == 1
+        # Verification of invalid password fails and is not cached
+        assert not verify_password('otherpwd', secret)
+        assert len([k for k in auth_module.credential_cache if k[0] == secret]) == 1
+        # Cached credential is used for repeated verification
+        assert verify_password('mypwd', secret)
+        # Cached credentials are not valid for a different password hash
+        assert not verify_password('mypwd', pbkdf2_sha256.hash('otherpwd'))
+
+    def test_verify_password_expired(self, monkeypatch):
+        """Test that cached credentials are verified against the password
+        hash again after they expired.
+        """
+        verified = list()
+
+        class CountingContext(object):
+            """Password context that records calls to verify."""
+            def verify(self, password, secret):
+                verified.append(secret)
+                return pbkdf2_sha256.verify(password, secret)
+
+        clock = [1000.0]
+        monkeypatch.setattr(auth_module, 'PASSWORD_CONTEXT', CountingContext())
+        monkeypatch.setattr(auth_module.time, 'monotonic', lambda: clock[0])
+        secret = pbkdf2_sha256.hash('mypwd')
+        assert verify_password('mypwd', secret)
+        assert len(verified) == 1
+        # Cached credential is used before the entry expires
+        clock[0] += auth_module.CREDENTIAL_CACHE_TTL - 1
+        assert verify_password('mypwd', secret)
+        assert len(verified) == 1
+        # Expired entry falls back to verifying the password hash
+        clock[0] += auth_module.CREDENTIAL_CACHE_TTL
+        assert verify_password('mypwd', secret)
+        assert len(verified) == 2
+        # The verification refreshes the cached entry
+        assert verify_password('mypwd', secret)
+        assert len(verified) == 2
+
+    def test_upgrade_password_hash(self, tmpdir):
+        """Test replacing deprecated password hashes on login."""
+        con = self.connect(tmpdir)
+        auth = Auth(con)
+        sql = 'SELECT secret FROM registered_user WHERE id = ?'
+        assert pbkdf2_sha256.identify(con.execute(sql, (USER_1,)).fetchone()[0])
+        auth.login(USER_1, USER_1)
+        secret = con.execute(sql, (USER_1,)).fetchone()[0]
+        assert secret.startswith('$argon2id$')
+        # User can still login with the new password hash
+        auth.login(USER_1, USER_1)
+        assert con.execute(sql, (USER_1,)).fetchone()[0] == secret
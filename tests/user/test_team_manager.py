@@ -110,6 +110,41 @@ class TestTeamManager(object):
         assert USER_1 in team.members
         assert not USER_2 in team.members
 
+    def test_add_members(self, tmpdir):
+        """Test adding a list of team members in a single batch."""
+        team_manager = self.connect(tmpdir)
+        team = team_manager.create_team(name='My Team', owner_id=USER_1)
+        team_manager.add_members(
+            team_id=team.identifier,
+            user_ids=[USER_2, USER_3]
+        )
+        team = team_manager.get_team(team.identifier)
+        assert team.member_count == 3
+        assert USER_2 in team.members
+        assert USER_3 in team.members
+        # Adding members to unknown team raises error
+        with pytest.raises(err.UnknownTeamError):
+            team_manager.add_members(team_id='unknown', user_ids=[USER_2])
+        # Adding duplicate or inactive users raises errors. No member is added
+        # if any of the users is invalid.
+        team = team_manager.create_team(name='Team 2', owner_id=USER_1)
+        with pytest.raises(err.DuplicateUserError):
+            team_manager.add_members(
+                team_id=team.identifier,
+                user_ids=[USER_2, USER_1]
+            )
+        with pytest.raises(err.DuplicateUserError):
+            team_manager.add_members(
+                team_id=team.identifier,
+                user_ids=[USER_2, USER_2]
+            )
+        with pytest.raises(err.UnknownUserError):
+            team_manager.add_members(
+                team_id=team.identifier,
+                user_ids=[USER_2, USER_4]
+            )
+        assert team_manager.get_team(team.identifier).member_count == 1
+
     def test_authorize(self, tmpdir):
         """Test user authorization."""
         # Create team with two members
@@ -188,6 +223,19 @@ class TestTeamManager(object):
                 team_id=team_id,
                 role=role.MEMBER
             )
+        # Authorization fails for unknown teams
+        with pytest.raises(err.UnknownTeamError):
+            team_manager.authorize(
+                access_token=token1,
+                team_id='unknown',
+                role=role.MEMBER
+            )
+        with pytest.raises(err.UnknownTeamError):
+            team_manager.authorize(
+                access_token=token1,
+                team_id='unknown',
+                role=role.OWNER
+            )
 
     def test_create_team(self, tmpdir):
         """Test creating new teams."""
@@ -306,8 +354,16 @@ class TestTeamManager(object):
                 team_id=team2.identifier,
                 name='My Team'
             )
+        with pytest.raises(err.ConstraintViolationError):
+            team_manager.update_team_name(
+                team_id=team2.identifier,
+                name=' My Team '
+            )
         with pytest.raises(err.ConstraintViolationError):
             team_manager.update_team_name(
                 team_id=team2.identifier,
                 name='A' * 256
             )
+        # Error when updating the name of an unknown team
+        with pytest.raises(err.UnknownTeamError):
+            team_manager.update_team_name(team_id='unknown', name='Unknown')
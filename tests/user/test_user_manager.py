@@ -69,6 +69,23 @@ class TestUserManager(object):
         for user in umanager.list_user():
             assert user.is_logged_in()
 
+    def test_legacy_expiry(self, tmpdir):
+        """Test handling of API keys and password reset requests that have an
+        expiry date in ISO format (as written by previous versions).
+        """
+        umanager = self.connect(tmpdir)
+        umanager.register_user('first.user@me.com', 'pwd1')
+        umanager.login('first.user@me.com', 'pwd1')
+        request_id = umanager.request_password_reset('first.user@me.com')
+        expires = '2019-08-29T10:00:00.000000'
+        umanager.con.execute('UPDATE user_key SET expires = ?', (expires,))
+        umanager.con.execute('UPDATE password_request SET expires = ?', (expires,))
+        umanager.con.commit()
+        for user in umanager.list_user():
+            assert not user.is_logged_in()
+        with pytest.raises(err.UnknownResourceError):
+            umanager.reset_password(request_id=request_id, password='mypwd')
+
     def test_register_user(self, tmpdir):
         """Test registering a new user."""
         umanager = self.connect(tmpdir)